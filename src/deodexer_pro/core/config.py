@@ -2,18 +2,89 @@
 Configuration management module for Deodexer Pro
 """
 
+import functools
 import os
 import yaml
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=512)
+def _split_key(path: str) -> tuple:
+    """Split a dotted config path once and cache the parts
+
+    The same handful of keys is looked up over and over, so the split
+    cost is paid once per distinct key instead of per call.
+    """
+    return tuple(path.split('.'))
+
+
+@functools.lru_cache(maxsize=512)
+def _join_key(parts: tuple) -> str:
+    """Join pre-split path parts once and cache the dotted form
+
+    Callers that already hold the parts as a tuple can pass them
+    directly; repeated lookups reuse the joined string.
+    """
+    return '.'.join(parts)
+
+
+def _flatten(nested: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Flatten a nested mapping into {'a.b.c': leaf} form
+
+    Walks with an explicit stack instead of recursing, so deeply nested
+    mappings cost no Python call frames and cannot trip the recursion
+    limit.
+    """
+    flat: Dict[str, Any] = {}
+    stack = [(prefix, nested)]
+    while stack:
+        prefix, mapping = stack.pop()
+        for key, value in mapping.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict) and value:
+                stack.append((f"{path}.", value))
+            else:
+                flat[path] = value
+    return flat
+
+
+def _unflatten(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the nested mapping from its flattened form"""
+    nested: Dict[str, Any] = {}
+    for path, value in flat.items():
+        keys = _split_key(path)
+        current = nested
+        for key in keys[:-1]:
+            current = current.setdefault(key, {})
+        current[keys[-1]] = value
+    return nested
+
+
+# Structure and value checks applied by validate(); built once at
+# import instead of inside every call
+_REQUIRED_SECTIONS = ('app', 'database', 'deodexing', 'gui')
+_VALIDATION_RULES = (
+    ('deodexing.max_workers', lambda value: value > 0),
+    ('deodexing.default_api_level', lambda value: value > 0),
+)
+
+
 class Config:
     """Advanced configuration management with environment support and validation"""
-    
+
+    # Fixed attribute set: no per-instance __dict__, and typos on
+    # assignment fail loudly instead of creating stray attributes
+    __slots__ = ('config_path', '_flat', '_dict_cache')
+
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._get_default_config_path()
-        self._config_data: Dict[str, Any] = {}
+        # Flat {'section.key': value} store: get() is one dict lookup
+        # instead of a walk through nested dicts
+        self._flat: Dict[str, Any] = {}
+        # Memoized nested view served by to_dict(); writes drop it
+        self._dict_cache: Optional[Dict[str, Any]] = None
         self._load_config()
     
     def _get_default_config_path(self) -> str:
@@ -23,15 +94,16 @@ class Config:
     
     def _load_config(self) -> None:
         """Load configuration from YAML file with environment variable override"""
+        self._dict_cache = None
         try:
             with open(self.config_path, 'r', encoding='utf-8') as file:
-                self._config_data = yaml.safe_load(file) or {}
-            
+                self._flat = _flatten(yaml.safe_load(file) or {})
+
             # Override with environment variables
             self._apply_environment_overrides()
-            
+
         except FileNotFoundError:
-            self._config_data = self._get_default_config()
+            self._flat = _flatten(self._get_default_config())
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
     
@@ -52,19 +124,34 @@ class Config:
     
     def _set_nested_value(self, path: tuple, value: str) -> None:
         """Set a nested configuration value"""
-        current = self._config_data
-        for key in path[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        
         # Type conversion
         if value.lower() in ('true', 'false'):
             value = value.lower() == 'true'
         elif value.isdigit():
             value = int(value)
-        
-        current[path[-1]] = value
+
+        self._store('.'.join(path), value)
+
+    def _store(self, path: str, value: Any) -> None:
+        """Insert one dotted-path entry, evicting anything it shadows"""
+        self._dict_cache = None
+        flat = self._flat
+        prefix = path + '.'
+
+        # A write at 'a.b' replaces any existing subtree below it, and a
+        # write at 'a.b.c' shadows a leaf previously stored at 'a.b'
+        stale = [key for key in flat if key.startswith(prefix)]
+        for key in stale:
+            del flat[key]
+        keys = _split_key(path)
+        for i in range(1, len(keys)):
+            flat.pop('.'.join(keys[:i]), None)
+
+        if isinstance(value, dict) and value:
+            flat.pop(path, None)
+            flat.update(_flatten(value, prefix))
+        else:
+            flat[path] = value
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration when no config file is found"""
@@ -95,29 +182,41 @@ class Config:
             }
         }
     
-    def get(self, path: str, default: Any = None) -> Any:
-        """Get configuration value using dot notation (e.g., 'database.path')"""
-        keys = path.split('.')
-        current = self._config_data
-        
+    def get(self, path, default: Any = None) -> Any:
+        """Get configuration value using dot notation (e.g., 'database.path')
+
+        Accepts either a dotted string or a pre-split tuple of parts.
+        """
+        if type(path) is tuple:
+            path = _join_key(path)
         try:
-            for key in keys:
-                current = current[key]
-            return current
-        except (KeyError, TypeError):
-            return default
+            return self._flat[path]
+        except KeyError:
+            pass
+
+        # Intermediate nodes are not stored directly; rebuild the
+        # requested subtree from the entries below it
+        prefix = path + '.'
+        subtree = {key[len(prefix):]: value
+                   for key, value in self._flat.items()
+                   if key.startswith(prefix)}
+        if subtree:
+            return _unflatten(subtree)
+        return default
     
-    def set(self, path: str, value: Any) -> None:
+    def getmany(self, paths: Dict[str, Any]) -> Dict[str, Any]:
+        """Get several dot-notation values in one call
+
+        Takes a mapping of path -> default and returns path -> value, so
+        callers batch related lookups instead of repeating get() calls.
+        """
+        return {path: self.get(path, default) for path, default in paths.items()}
+
+    def set(self, path, value: Any) -> None:
         """Set configuration value using dot notation"""
-        keys = path.split('.')
-        current = self._config_data
-        
-        for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
-        
-        current[keys[-1]] = value
+        if type(path) is tuple:
+            path = _join_key(path)
+        self._store(path, value)
     
     def save(self, path: Optional[str] = None) -> None:
         """Save configuration to file"""
@@ -125,7 +224,7 @@ class Config:
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
         
         with open(save_path, 'w', encoding='utf-8') as file:
-            yaml.dump(self._config_data, file, default_flow_style=False, indent=2)
+            yaml.dump(self._nested(), file, default_flow_style=False, indent=2)
     
     def reload(self) -> None:
         """Reload configuration from file"""
@@ -133,36 +232,66 @@ class Config:
     
     def validate(self) -> bool:
         """Validate configuration structure and values"""
-        required_sections = ['app', 'database', 'deodexing', 'gui']
-        
-        for section in required_sections:
-            if section not in self._config_data:
+        for section in _REQUIRED_SECTIONS:
+            prefix = section + '.'
+            if section not in self._flat and \
+                    not any(key.startswith(prefix) for key in self._flat):
                 return False
-        
-        # Validate specific values
-        if self.get('deodexing.max_workers', 0) <= 0:
-            return False
-        
-        if self.get('deodexing.default_api_level', 0) <= 0:
-            return False
-        
-        return True
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Get configuration as dictionary"""
-        return self._config_data.copy()
+
+        return all(predicate(self.get(path, 0))
+                   for path, predicate in _VALIDATION_RULES)
     
+    def _nested(self) -> Dict[str, Any]:
+        """Memoized nested form of the flat store, rebuilt after writes"""
+        if self._dict_cache is None:
+            self._dict_cache = _unflatten(self._flat)
+        return self._dict_cache
+
+    def to_dict(self) -> Mapping[str, Any]:
+        """Get configuration as a read-only mapping
+
+        The nested form is rebuilt lazily and memoized until the next
+        write; the proxy view stops callers from mutating the cache
+        behind the flat store's back. Serializers that need a real dict
+        can take dict(config.to_dict()) — a shallow copy suffices.
+        """
+        return MappingProxyType(self._nested())
+
     def update(self, new_config: Dict[str, Any]) -> None:
         """Update configuration with new values"""
-        self._deep_merge(self._config_data, new_config)
-    
-    def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> None:
-        """Deep merge two dictionaries"""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        # Flattening the incoming mapping gives deep-merge semantics for
+        # free: only the leaves it mentions are overwritten
+        flat_new = _flatten(new_config)
+        if not flat_new:
+            return
+        self._dict_cache = None
+
+        # Empty sub-dicts merge as no-ops, exactly as the recursive
+        # merge did; letting them through the eviction pass below would
+        # wipe the whole existing subtree. One is recorded only when
+        # nothing exists at or under its path yet
+        for path in [p for p, v in flat_new.items()
+                     if isinstance(v, dict) and not v]:
+            del flat_new[path]
+            prefix = path + '.'
+            if path not in self._flat and \
+                    not any(key.startswith(prefix) for key in self._flat):
+                self._flat[path] = {}
+        if not flat_new:
+            return
+
+        # Evict everything the batch shadows, then land the whole batch
+        # with a single dict.update instead of per-key _store calls
+        prefixes = tuple(path + '.' for path in flat_new)
+        stale = [key for key in self._flat
+                 if key not in flat_new and key.startswith(prefixes)]
+        for key in stale:
+            del self._flat[key]
+        for path in flat_new:
+            keys = _split_key(path)
+            for i in range(1, len(keys)):
+                self._flat.pop('.'.join(keys[:i]), None)
+        self._flat.update(flat_new)
 
 
 # Global configuration instance
@@ -23,6 +23,12 @@ from ..utils.performance import PerformanceMonitor
 from ..ml.optimizer import DeodexingOptimizer
 
 
+# JVM flags that amortize startup cost across the many short-lived baksmali
+# invocations: reuse the shared class-data archive and stop the JIT at the
+# first tier, since each process lives for well under the C2 warmup window
+DEFAULT_JVM_FLAGS = ["-Xshare:auto", "-XX:TieredStopAtLevel=1"]
+
+
 class DeodexingStatus(Enum):
     """Status enumeration for deodexing operations"""
     PENDING = "pending"
@@ -149,8 +155,10 @@ class DeodexerEngine:
             )
             
             # Build command with optimized parameters
+            jvm_flags = config.get('deodexing.jvm_flags', DEFAULT_JVM_FLAGS)
             command = [
-                "java", "-jar", self.baksmali_jar,
+                "java", *jvm_flags,
+                "-jar", self.baksmali_jar,
                 "deodex",
                 "-a", str(api_level),
                 "-d", framework_dir,
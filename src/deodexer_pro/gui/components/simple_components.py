@@ -4,22 +4,77 @@ Simplified GUI components for initial testing
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import operator
 import os
 import asyncio
 import threading
 import time
+from datetime import datetime
 from pathlib import Path
 
+from ...utils._platform import list_directory
+
+# File-type labels keyed by extension, built once at import time
+_FILE_TYPE_MAP = {
+    '.odex': 'ODEX File',
+    '.apk': 'Android Package',
+    '.jar': 'Java Archive',
+    '.dex': 'Dalvik Executable',
+    '.smali': 'Smali Source',
+    '.xml': 'XML Document',
+    '.txt': 'Text File',
+    '.log': 'Log File',
+    '.json': 'JSON Data',
+    '.csv': 'CSV Data'
+}
+
+# Size units indexed by how many 1024-steps fit into the value
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+# JSON helpers for settings import/export: prefer orjson's C parser when
+# it is installed, fall back to the stdlib otherwise
+try:
+    import orjson as _json
+
+    def _json_loads(data):
+        return _json.loads(data)
+
+    def _json_dumps(obj):
+        return _json.dumps(obj, option=_json.OPT_INDENT_2)
+except ImportError:
+    import json as _json
+
+    def _json_loads(data):
+        return _json.loads(data)
+
+    def _json_dumps(obj):
+        return _json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _fmt_mtime(ts):
+    """Format a modification timestamp without the libc locale machinery"""
+    d = datetime.fromtimestamp(ts)
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+
 
 class JobManagerFrame(ttk.Frame):
     """Functional Job Manager Frame for deodexing operations"""
     
-    def __init__(self, parent, engine, db_manager):
+    def __init__(self, parent, engine, db_manager, on_jobs_changed=None):
         super().__init__(parent)
         self.engine = engine
         self.db_manager = db_manager
         self.current_job = None
+        # Invoked whenever job state changes, so the owning window can
+        # re-query statistics only when there is something new to show
+        self.on_jobs_changed = on_jobs_changed
         self._setup_ui()
+
+    def _notify_jobs_changed(self):
+        """Tell the owning window that job statistics are stale"""
+        if self.on_jobs_changed is not None:
+            self.on_jobs_changed()
         
     def _setup_ui(self):
         """Setup the job manager interface"""
@@ -368,6 +423,7 @@ class JobManagerFrame(ttk.Frame):
         # Start deodexing in separate thread
         self.deodex_thread = threading.Thread(target=self._run_deodexing, daemon=True)
         self.deodex_thread.start()
+        self._notify_jobs_changed()
     
     def _validate_inputs(self):
         """Validate inputs before starting"""
@@ -457,6 +513,7 @@ class JobManagerFrame(ttk.Frame):
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.progress_var.set(100)
+        self._notify_jobs_changed()
         
         # Display results
         summary = report['summary']
@@ -498,6 +555,7 @@ class JobManagerFrame(ttk.Frame):
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.status_var.set("Failed")
+        self._notify_jobs_changed()
         
         # Log error
         self._log_message(f"\n=== DEODEXING FAILED ===")
@@ -666,11 +724,18 @@ class ProgressMonitorFrame(ttk.Frame):
 
 class FileBrowserFrame(ttk.Frame):
     """File Browser Frame for exploring ODEX files and results"""
-    
+
+    # Rows shown per directory before the "... N more" sentinel kicks in
+    MAX_ROWS = 5000
+
     def __init__(self, parent):
         super().__init__(parent)
+        self._dir_summary_cache = {}
+        self._max_rows = self.MAX_ROWS
+        self._select_after_id = None
+        self._show_hidden = False
         self._setup_ui()
-    
+
     def _setup_ui(self):
         """Setup file browser interface"""
         main_frame = ttk.Frame(self)
@@ -718,6 +783,10 @@ class FileBrowserFrame(ttk.Frame):
         self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        # Configure tag colors (static, so only once at setup)
+        self.file_tree.tag_configure('directory', foreground='blue')
+        self.file_tree.tag_configure('odex', foreground='red', font=('TkDefaultFont', 9, 'bold'))
         
         # Info panel
         info_frame = ttk.LabelFrame(main_frame, text="File Information", padding=10)
@@ -734,13 +803,15 @@ class FileBrowserFrame(ttk.Frame):
         self.file_tree.bind('<Double-1>', self._on_item_double_click)
         self.file_tree.bind('<<TreeviewSelect>>', self._on_item_select)
         
-        # Initial load
-        self._load_directory(self.path_var.get())
+        # Defer the initial load so first paint doesn't wait on the
+        # starting directory's size
+        self.after_idle(self._load_directory, self.path_var.get())
     
     def _browse_path(self):
         """Browse for a directory"""
         directory = filedialog.askdirectory(title="Select Directory to Browse")
         if directory:
+            self._max_rows = self.MAX_ROWS
             self.path_var.set(directory)
             self._load_directory(directory)
     
@@ -755,69 +826,74 @@ class FileBrowserFrame(ttk.Frame):
             if os.path.dirname(path) != path:
                 self.file_tree.insert('', 0, text='..', values=('', 'Directory', ''), tags=('parent',))
             
-            # List directory contents
+            # List directory contents (batched per-platform enumeration)
             if os.path.isdir(path):
-                items = []
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    try:
-                        stat = os.stat(item_path)
-                        if os.path.isdir(item_path):
-                            size = ''
-                            file_type = 'Directory'
-                        else:
-                            size = self._format_size(stat.st_size)
-                            file_type = self._get_file_type(item)
-                        
-                        modified = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat.st_mtime))
-                        items.append((item, size, file_type, modified, os.path.isdir(item_path)))
-                    except (OSError, IOError):
-                        # Skip inaccessible items
-                        continue
-                
-                # Sort: directories first, then files
-                items.sort(key=lambda x: (not x[4], x[0].lower()))
-                
-                # Insert items
-                for item, size, file_type, modified, is_dir in items:
-                    tags = ('directory',) if is_dir else ('file',)
-                    if item.endswith('.odex'):
-                        tags = tags + ('odex',)
-                    
-                    self.file_tree.insert('', tk.END, text=item, values=(size, file_type, modified), tags=tags)
-                
-                # Configure tag colors
-                self.file_tree.tag_configure('directory', foreground='blue')
-                self.file_tree.tag_configure('odex', foreground='red', font=('TkDefaultFont', 9, 'bold'))
+                # Bucket into directories and files during the scan so each
+                # bucket sorts independently on its precomputed key
+                dirs = []
+                files = []
+                for item, is_dir, raw_size, mtime in list_directory(path, self._show_hidden):
+                    if is_dir:
+                        size = ''
+                        file_type = 'Directory'
+                    else:
+                        size = self._format_size(raw_size)
+                        file_type = self._get_file_type(item)
+
+                    modified = _fmt_mtime(mtime)
+                    bucket = dirs if is_dir else files
+                    bucket.append((item, size, file_type, modified, is_dir, item.lower()))
+
+                # Directories first, then files, each sorted by name
+                sort_key = operator.itemgetter(5)
+                dirs.sort(key=sort_key)
+                files.sort(key=sort_key)
+                items = dirs + files
+
+                # Cap rendered rows so huge directories stay responsive
+                truncated = len(items) - self._max_rows
+                if truncated > 0:
+                    items = items[:self._max_rows]
                 
+                # Insert items with the tree detached so Tk doesn't re-layout
+                # per row; go through tk.call directly to skip the
+                # ttk.Treeview.insert argument marshalling on every row
+                self.file_tree.pack_forget()
+                tree_path = self.file_tree._w
+                tk_call = self.tk.call
+                try:
+                    for item, size, file_type, modified, is_dir, _ in items:
+                        tags = ('directory',) if is_dir else ('file',)
+                        if item.endswith('.odex'):
+                            tags = tags + ('odex',)
+
+                        tk_call(tree_path, 'insert', '', 'end',
+                                '-text', item,
+                                '-values', (size, file_type, modified),
+                                '-tags', tags)
+                finally:
+                    self.file_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+                if truncated > 0:
+                    self.file_tree.insert('', tk.END, iid='__more__',
+                                          text=f'… {truncated} more items (double-click to load)',
+                                          values=('', '', ''), tags=('more',))
+
         except Exception as e:
             self.info_text.delete(1.0, tk.END)
             self.info_text.insert(tk.END, f"Error loading directory: {str(e)}")
     
     def _format_size(self, size):
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        # Unit index straight from the bit length: one integer op and one
+        # divide instead of a division loop per row
+        shift = min(max(0, (int(size).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+        return f"{size / (1 << (shift * 10)):.1f} {_SIZE_UNITS[shift]}"
     
     def _get_file_type(self, filename):
         """Get file type based on extension"""
-        ext = os.path.splitext(filename)[1].lower()
-        type_map = {
-            '.odex': 'ODEX File',
-            '.apk': 'Android Package',
-            '.jar': 'Java Archive',
-            '.dex': 'Dalvik Executable',
-            '.smali': 'Smali Source',
-            '.xml': 'XML Document',
-            '.txt': 'Text File',
-            '.log': 'Log File',
-            '.json': 'JSON Data',
-            '.csv': 'CSV Data'
-        }
-        return type_map.get(ext, 'File')
+        i = filename.rfind('.')
+        return _FILE_TYPE_MAP.get(filename[i:].lower(), 'File') if i >= 0 else 'File'
     
     def _on_item_double_click(self, event):
         """Handle double-click on tree item"""
@@ -825,29 +901,45 @@ class FileBrowserFrame(ttk.Frame):
         if selection:
             item = selection[0]
             item_text = self.file_tree.item(item, 'text')
-            
-            if item_text == '..':
+
+            if item == '__more__':
+                # Load the next batch of capped rows
+                self._max_rows += self.MAX_ROWS
+                self._load_directory(self.path_var.get())
+            elif item_text == '..':
                 # Go to parent directory
                 current_path = self.path_var.get()
                 parent_path = os.path.dirname(current_path)
+                self._max_rows = self.MAX_ROWS
                 self.path_var.set(parent_path)
                 self._load_directory(parent_path)
             else:
                 # Navigate into directory or show file info
                 current_path = self.path_var.get()
                 item_path = os.path.join(current_path, item_text)
-                
+
                 if os.path.isdir(item_path):
+                    self._max_rows = self.MAX_ROWS
                     self.path_var.set(item_path)
                     self._load_directory(item_path)
     
     def _on_item_select(self, event):
-        """Handle item selection"""
+        """Handle item selection (debounced so held-key navigation coalesces)"""
         selection = self.file_tree.selection()
-        if selection:
-            item = selection[0]
+        if not selection:
+            return
+
+        # Only the settle-on-item event pays the stat cost
+        if self._select_after_id:
+            self.after_cancel(self._select_after_id)
+        self._select_after_id = self.after(80, self._apply_selection, selection[0])
+
+    def _apply_selection(self, item):
+        """Show file information for the selected item"""
+        self._select_after_id = None
+        if self.file_tree.exists(item):
             item_text = self.file_tree.item(item, 'text')
-            
+
             if item_text != '..':
                 current_path = self.path_var.get()
                 item_path = os.path.join(current_path, item_text)
@@ -859,7 +951,7 @@ class FileBrowserFrame(ttk.Frame):
                         stat = os.stat(item_path)
                         info = f"Path: {item_path}\n"
                         info += f"Size: {self._format_size(stat.st_size)}\n"
-                        info += f"Modified: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat.st_mtime))}\n"
+                        info += f"Modified: {_fmt_mtime(stat.st_mtime)}\n"
                         
                         if item_text.endswith('.odex'):
                             info += "\n*** ODEX FILE ***\nThis file can be deodexed using the Job Manager."
@@ -867,8 +959,7 @@ class FileBrowserFrame(ttk.Frame):
                         self.info_text.insert(tk.END, info)
                     elif os.path.isdir(item_path):
                         try:
-                            item_count = len(os.listdir(item_path))
-                            odex_count = sum(1 for f in os.listdir(item_path) if f.endswith('.odex'))
+                            item_count, odex_count = self._summarize_directory(item_path)
                             info = f"Directory: {item_path}\n"
                             info += f"Items: {item_count}\n"
                             if odex_count > 0:
@@ -879,6 +970,24 @@ class FileBrowserFrame(ttk.Frame):
                 except Exception as e:
                     self.info_text.insert(tk.END, f"Error: {str(e)}")
 
+    def _summarize_directory(self, path):
+        """Count entries and ODEX files in a directory with one scan"""
+        cached = self._dir_summary_cache.get(path)
+        now = time.monotonic()
+        if cached and now - cached[2] < 2.0:  # 2-second TTL for rapid re-selection
+            return cached[0], cached[1]
+
+        total = 0
+        odex = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                total += 1
+                if entry.name.endswith('.odex'):
+                    odex += 1
+
+        self._dir_summary_cache[path] = (total, odex, now)
+        return total, odex
+
 
 class SettingsFrame(ttk.Frame):
     """Settings Frame for application configuration"""
@@ -897,54 +1006,98 @@ class SettingsFrame(ttk.Frame):
         title_label = ttk.Label(main_frame, text="Application Settings", style='Title.TLabel')
         title_label.pack(pady=(0, 20))
         
-        # Create notebook for settings categories
+        # Settings variables live here so saving/refreshing works even for
+        # tabs whose widgets haven't been built yet
+        self.debug_var = tk.BooleanVar()
+        self.autosave_var = tk.BooleanVar(value=True)
+        self.check_updates_var = tk.BooleanVar(value=True)
+        self.default_api_var = tk.StringVar(value="29")
+        self.default_workers_var = tk.StringVar(value="4")
+        self.timeout_var = tk.StringVar(value="300")
+        self.auto_baksmali_var = tk.BooleanVar(value=True)
+        self.theme_var = tk.StringVar(value="light")
+        self.window_width_var = tk.StringVar(value="1200")
+        self.window_height_var = tk.StringVar(value="800")
+        self.center_window_var = tk.BooleanVar(value=True)
+        self.remember_tabs_var = tk.BooleanVar(value=True)
+        self.log_level_var = tk.StringVar(value="INFO")
+        self.cleanup_db_var = tk.BooleanVar(value=True)
+        self.monitor_performance_var = tk.BooleanVar(value=True)
+        self.experimental_var = tk.BooleanVar(value=False)
+
+        # Create notebook for settings categories; tab bodies are built
+        # lazily on first visit
         settings_notebook = ttk.Notebook(main_frame)
         settings_notebook.pack(fill=tk.BOTH, expand=True)
-        
-        # General settings tab
-        general_frame = ttk.Frame(settings_notebook)
-        settings_notebook.add(general_frame, text="General")
-        self._create_general_settings(general_frame)
-        
-        # Deodexing settings tab
-        deodex_frame = ttk.Frame(settings_notebook)
-        settings_notebook.add(deodex_frame, text="Deodexing")
-        self._create_deodex_settings(deodex_frame)
-        
-        # GUI settings tab
-        gui_frame = ttk.Frame(settings_notebook)
-        settings_notebook.add(gui_frame, text="Interface")
-        self._create_gui_settings(gui_frame)
-        
-        # Advanced settings tab
-        advanced_frame = ttk.Frame(settings_notebook)
-        settings_notebook.add(advanced_frame, text="Advanced")
-        self._create_advanced_settings(advanced_frame)
-        
+
+        self._tab_builders = []
+        for tab_text, builder in (("General", self._create_general_settings),
+                                  ("Deodexing", self._create_deodex_settings),
+                                  ("Interface", self._create_gui_settings),
+                                  ("Advanced", self._create_advanced_settings)):
+            tab_frame = ttk.Frame(settings_notebook)
+            settings_notebook.add(tab_frame, text=tab_text)
+            self._tab_builders.append((tab_frame, builder))
+
+        self._built_tabs = set()
+        self._settings_notebook = settings_notebook
+        settings_notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_tab(0)
+
+        # Settings fields as (config_key, variable, default, cast) rows so
+        # save/refresh walk one table instead of rebuilding nested dicts
+        self._settings_fields = (
+            ('app.debug', self.debug_var, False, None),
+            ('app.autosave', self.autosave_var, True, None),
+            ('app.check_updates', self.check_updates_var, True, None),
+            ('deodexing.default_api_level', self.default_api_var, 29, int),
+            ('deodexing.max_workers', self.default_workers_var, 4, int),
+            ('deodexing.timeout', self.timeout_var, 300, int),
+            ('deodexing.auto_detect_baksmali', self.auto_baksmali_var, True, None),
+            ('gui.theme', self.theme_var, 'light', None),
+            ('gui.window.width', self.window_width_var, 1200, int),
+            ('gui.window.height', self.window_height_var, 800, int),
+            ('gui.window.center_on_start', self.center_window_var, True, None),
+            ('gui.remember_tabs', self.remember_tabs_var, True, None),
+            ('advanced.log_level', self.log_level_var, 'INFO', None),
+            ('advanced.cleanup_database', self.cleanup_db_var, True, None),
+            ('advanced.monitor_performance', self.monitor_performance_var, True, None),
+            ('advanced.experimental_features', self.experimental_var, False, None),
+        )
+
         # Control buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X, pady=(20, 0))
-        
+
         ttk.Button(button_frame, text="Save Settings", command=self.save_settings).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(button_frame, text="Reset to Defaults", command=self._reset_defaults).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Import Settings", command=self._import_settings).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Export Settings", command=self._export_settings).pack(side=tk.LEFT, padx=5)
-    
+
+    def _build_tab(self, index):
+        """Build a settings tab's widgets on first visit"""
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        tab_frame, builder = self._tab_builders[index]
+        builder(tab_frame)
+
+    def _on_tab_changed(self, event):
+        """Lazily construct tab contents when a tab is first selected"""
+        self._build_tab(self._settings_notebook.index('current'))
+
     def _create_general_settings(self, parent):
         """Create general settings controls"""
         frame = ttk.LabelFrame(parent, text="General Settings", padding=10)
         frame.pack(fill=tk.X, padx=10, pady=10)
         
         # Debug mode
-        self.debug_var = tk.BooleanVar()
         ttk.Checkbutton(frame, text="Debug Mode", variable=self.debug_var).pack(anchor=tk.W, pady=2)
-        
+
         # Auto-save
-        self.autosave_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(frame, text="Auto-save configuration", variable=self.autosave_var).pack(anchor=tk.W, pady=2)
-        
+
         # Check for updates
-        self.check_updates_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(frame, text="Check for updates on startup", variable=self.check_updates_var).pack(anchor=tk.W, pady=2)
     
     def _create_deodex_settings(self, parent):
@@ -956,25 +1109,21 @@ class SettingsFrame(ttk.Frame):
         api_frame = ttk.Frame(frame)
         api_frame.pack(fill=tk.X, pady=5)
         ttk.Label(api_frame, text="Default API Level:").pack(side=tk.LEFT)
-        self.default_api_var = tk.StringVar(value="29")
         ttk.Spinbox(api_frame, from_=1, to=34, width=10, textvariable=self.default_api_var).pack(side=tk.LEFT, padx=(10, 0))
         
         # Max workers
         workers_frame = ttk.Frame(frame)
         workers_frame.pack(fill=tk.X, pady=5)
         ttk.Label(workers_frame, text="Default Max Workers:").pack(side=tk.LEFT)
-        self.default_workers_var = tk.StringVar(value="4")
         ttk.Spinbox(workers_frame, from_=1, to=16, width=10, textvariable=self.default_workers_var).pack(side=tk.LEFT, padx=(10, 0))
         
         # Timeout
         timeout_frame = ttk.Frame(frame)
         timeout_frame.pack(fill=tk.X, pady=5)
         ttk.Label(timeout_frame, text="Operation Timeout (seconds):").pack(side=tk.LEFT)
-        self.timeout_var = tk.StringVar(value="300")
         ttk.Spinbox(timeout_frame, from_=60, to=1800, width=10, textvariable=self.timeout_var).pack(side=tk.LEFT, padx=(10, 0))
-        
+
         # Auto-detect baksmali
-        self.auto_baksmali_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(frame, text="Auto-detect baksmali JAR on startup", variable=self.auto_baksmali_var).pack(anchor=tk.W, pady=2)
     
     def _create_gui_settings(self, parent):
@@ -986,7 +1135,6 @@ class SettingsFrame(ttk.Frame):
         theme_frame = ttk.Frame(frame)
         theme_frame.pack(fill=tk.X, pady=5)
         ttk.Label(theme_frame, text="Theme:").pack(side=tk.LEFT)
-        self.theme_var = tk.StringVar(value="light")
         theme_combo = ttk.Combobox(theme_frame, textvariable=self.theme_var, values=["light", "dark"], state="readonly", width=15)
         theme_combo.pack(side=tk.LEFT, padx=(10, 0))
         
@@ -994,17 +1142,13 @@ class SettingsFrame(ttk.Frame):
         size_frame = ttk.Frame(frame)
         size_frame.pack(fill=tk.X, pady=5)
         ttk.Label(size_frame, text="Default Window Size:").pack(side=tk.LEFT)
-        self.window_width_var = tk.StringVar(value="1200")
-        self.window_height_var = tk.StringVar(value="800")
         ttk.Spinbox(size_frame, from_=800, to=2000, width=8, textvariable=self.window_width_var).pack(side=tk.LEFT, padx=(10, 0))
         ttk.Label(size_frame, text="x").pack(side=tk.LEFT, padx=5)
         ttk.Spinbox(size_frame, from_=600, to=1500, width=8, textvariable=self.window_height_var).pack(side=tk.LEFT)
         
         # Other GUI options
-        self.center_window_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(frame, text="Center window on startup", variable=self.center_window_var).pack(anchor=tk.W, pady=2)
-        
-        self.remember_tabs_var = tk.BooleanVar(value=True)
+
         ttk.Checkbutton(frame, text="Remember last active tab", variable=self.remember_tabs_var).pack(anchor=tk.W, pady=2)
     
     def _create_advanced_settings(self, parent):
@@ -1016,88 +1160,40 @@ class SettingsFrame(ttk.Frame):
         log_frame = ttk.Frame(frame)
         log_frame.pack(fill=tk.X, pady=5)
         ttk.Label(log_frame, text="Logging Level:").pack(side=tk.LEFT)
-        self.log_level_var = tk.StringVar(value="INFO")
-        log_combo = ttk.Combobox(log_frame, textvariable=self.log_level_var, 
+        log_combo = ttk.Combobox(log_frame, textvariable=self.log_level_var,
                                 values=["DEBUG", "INFO", "WARNING", "ERROR"], state="readonly", width=15)
         log_combo.pack(side=tk.LEFT, padx=(10, 0))
         
         # Database settings
-        self.cleanup_db_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(frame, text="Auto-cleanup old job records", variable=self.cleanup_db_var).pack(anchor=tk.W, pady=2)
-        
+
         # Performance settings
-        self.monitor_performance_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(frame, text="Monitor system performance", variable=self.monitor_performance_var).pack(anchor=tk.W, pady=2)
-        
+
         # Experimental features
-        self.experimental_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(frame, text="Enable experimental features", variable=self.experimental_var).pack(anchor=tk.W, pady=2)
     
     def save_settings(self):
         """Save current settings"""
         try:
-            # Update configuration with current values
-            settings = {
-                'app': {
-                    'debug': self.debug_var.get(),
-                    'autosave': self.autosave_var.get(),
-                    'check_updates': self.check_updates_var.get()
-                },
-                'deodexing': {
-                    'default_api_level': int(self.default_api_var.get()),
-                    'max_workers': int(self.default_workers_var.get()),
-                    'timeout': int(self.timeout_var.get()),
-                    'auto_detect_baksmali': self.auto_baksmali_var.get()
-                },
-                'gui': {
-                    'theme': self.theme_var.get(),
-                    'window': {
-                        'width': int(self.window_width_var.get()),
-                        'height': int(self.window_height_var.get()),
-                        'center_on_start': self.center_window_var.get()
-                    },
-                    'remember_tabs': self.remember_tabs_var.get()
-                },
-                'advanced': {
-                    'log_level': self.log_level_var.get(),
-                    'cleanup_database': self.cleanup_db_var.get(),
-                    'monitor_performance': self.monitor_performance_var.get(),
-                    'experimental_features': self.experimental_var.get()
-                }
-            }
-            
-            # Update config object
-            self.config.update(settings)
-            
+            # Update config object from the field table
+            for key, var, _default, cast in self._settings_fields:
+                value = var.get()
+                self.config.set(key, cast(value) if cast else value)
+
             messagebox.showinfo("Settings Saved", "Settings have been saved successfully!")
-            
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
-    
+
     def refresh_settings(self):
         """Refresh settings from config"""
         try:
-            # Load values from config
-            self.debug_var.set(self.config.get('app.debug', False))
-            self.autosave_var.set(self.config.get('app.autosave', True))
-            self.check_updates_var.set(self.config.get('app.check_updates', True))
-            
-            self.default_api_var.set(str(self.config.get('deodexing.default_api_level', 29)))
-            self.default_workers_var.set(str(self.config.get('deodexing.max_workers', 4)))
-            self.timeout_var.set(str(self.config.get('deodexing.timeout', 300)))
-            self.auto_baksmali_var.set(self.config.get('deodexing.auto_detect_baksmali', True))
-            
-            self.theme_var.set(self.config.get('gui.theme', 'light'))
-            self.window_width_var.set(str(self.config.get('gui.window.width', 1200)))
-            self.window_height_var.set(str(self.config.get('gui.window.height', 800)))
-            self.center_window_var.set(self.config.get('gui.window.center_on_start', True))
-            self.remember_tabs_var.set(self.config.get('gui.remember_tabs', True))
-            
-            self.log_level_var.set(self.config.get('advanced.log_level', 'INFO'))
-            self.cleanup_db_var.set(self.config.get('advanced.cleanup_database', True))
-            self.monitor_performance_var.set(self.config.get('advanced.monitor_performance', True))
-            self.experimental_var.set(self.config.get('advanced.experimental_features', False))
-            
+            # Load values from config via the field table
+            for key, var, default, cast in self._settings_fields:
+                value = self.config.get(key, default)
+                var.set(str(value) if cast else value)
+
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load settings: {str(e)}")
     
@@ -1130,9 +1226,8 @@ class SettingsFrame(ttk.Frame):
         )
         if file_path:
             try:
-                import json
-                with open(file_path, 'r') as f:
-                    settings = json.load(f)
+                with open(file_path, 'rb') as f:
+                    settings = _json_loads(f.read())
                 self.config.update(settings)
                 self.refresh_settings()
                 messagebox.showinfo("Success", "Settings imported successfully!")
@@ -1148,33 +1243,8 @@ class SettingsFrame(ttk.Frame):
         )
         if file_path:
             try:
-                import json
-                with open(file_path, 'w') as f:
-                    json.dump(self.config.to_dict(), f, indent=2)
+                with open(file_path, 'wb') as f:
+                    f.write(_json_dumps(dict(self.config.to_dict())))
                 messagebox.showinfo("Success", "Settings exported successfully!")
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to export settings: {str(e)}")
-
-
-# Add missing imports at the top of the file
-        super().__init__(parent)
-        self.config = config
-        
-        label = ttk.Label(self, text="Settings - Coming Soon", style='Title.TLabel')
-        label.pack(expand=True)
-    
-    def refresh_settings(self):
-        pass
-    
-    def save_settings(self):
-        pass
-
-
-class FileBrowserFrame(ttk.Frame):
-    """Simplified File Browser Frame"""
-    
-    def __init__(self, parent):
-        super().__init__(parent)
-        
-        label = ttk.Label(self, text="File Browser - Coming Soon", style='Title.TLabel')
-        label.pack(expand=True)
\ No newline at end of file
+                messagebox.showerror("Error", f"Failed to export settings: {str(e)}")
\ No newline at end of file
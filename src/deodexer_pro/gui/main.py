@@ -5,18 +5,73 @@ Main GUI Application for Deodexer Pro
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import asyncio
+import os
+import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 import json
 from datetime import datetime
 
+# Optional fast JSON parser for configuration import/export
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Imported once here instead of per status-bar tick
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 from ..core.config import config
 from ..core.logger import logger
 from ..core.deodexer import DeodexerEngine, DeodexingResult
 from ..database.manager import DatabaseManager
 from .components.dashboard import DashboardFrame
-from .components.simple_components import JobManagerFrame, ProgressMonitorFrame, SettingsFrame, FileBrowserFrame
+
+# Combined status line, preformatted once; one StringVar write updates the
+# message, job count and memory readout in a single label relayout
+_STATUS_TEMPLATE = "{} | Jobs: {} | Memory: {:.1f}%"
+
+# Custom styles as precomputed Tcl scripts: one interpreter round-trip
+# applies the whole batch instead of one per style.configure call
+_BASE_STYLE_SCRIPT = (
+    "ttk::style configure Title.TLabel -font {Arial 12 bold};"
+    "ttk::style configure Heading.TLabel -font {Arial 10 bold};"
+    "ttk::style configure Success.TLabel -foreground green;"
+    "ttk::style configure Error.TLabel -foreground red;"
+    "ttk::style configure Warning.TLabel -foreground orange"
+)
+_DARK_STYLE_SCRIPT = (
+    "ttk::style configure TFrame -background #2d2d2d;"
+    "ttk::style configure TLabel -background #2d2d2d -foreground white;"
+    "ttk::style configure TNotebook -background #2d2d2d;"
+    "ttk::style configure TNotebook.Tab -background #404040 -foreground white"
+)
+
+# Platform theme resolved once per process; kept out of the config
+# store so it never leaks into saved or exported configuration
+_resolved_theme: Optional[str] = None
+
+
+def _new_background_loop() -> asyncio.AbstractEventLoop:
+    """Pick the fastest event loop implementation for this platform
+
+    On Windows the proactor's IOCP machinery is unused here, so the
+    plain selector loop has less overhead; elsewhere uvloop is preferred
+    when installed.
+    """
+    if sys.platform == 'win32':
+        return asyncio.SelectorEventLoop()
+    try:
+        import uvloop
+        return uvloop.new_event_loop()
+    except ImportError:
+        return asyncio.new_event_loop()
 
 
 class DeodexerProGUI:
@@ -24,25 +79,41 @@ class DeodexerProGUI:
     
     def __init__(self):
         self.root = tk.Tk()
+        # Freeze DPI scaling and resolve the default font once, before any
+        # widget exists, so Tk skips per-widget font metric measurement
+        self.root.tk.call('tk', 'scaling', self.root.tk.call('tk', 'scaling'))
+        self.root.option_add('*Font', 'Arial 9')
+        self.root.option_add('*TCombobox*Listbox.font', 'Arial 9')
         self.engine = DeodexerEngine()
         self.db_manager = DatabaseManager()
         self.current_job = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        # Shared pool for file-dialog I/O so reads/writes never block Tk
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gui-io')
         self._setup_gui()
-        self._setup_event_loop()
-        
+
     def _setup_gui(self) -> None:
         """Setup the main GUI interface"""
-        # Configure main window
-        self.root.title(f"{config.get('app.name', 'Deodexer Pro')} v{config.get('app.version', '2.0.0')}")
-        self.root.geometry(f"{config.get('gui.window.width', 1200)}x{config.get('gui.window.height', 800)}")
+        # Configure main window (all startup settings fetched in one batch)
+        cfg = config.getmany({
+            'app.name': 'Deodexer Pro',
+            'app.version': '2.0.0',
+            'gui.window.width': 1200,
+            'gui.window.height': 800,
+            'gui.window.center_on_start': True,
+            'gui.theme': 'light',
+        })
+        self.root.title(f"{cfg['app.name']} v{cfg['app.version']}")
+        self.root.geometry(f"{cfg['gui.window.width']}x{cfg['gui.window.height']}")
         self.root.minsize(800, 600)
-        
+
         # Center window on screen
-        if config.get('gui.window.center_on_start', True):
+        if cfg['gui.window.center_on_start']:
             self._center_window()
-        
+
         # Configure style
-        self._setup_theme()
+        self._setup_theme(cfg['gui.theme'])
         
         # Create menu bar
         self._create_menu_bar()
@@ -71,37 +142,30 @@ class DeodexerProGUI:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
     
-    def _setup_theme(self) -> None:
+    def _setup_theme(self, theme_pref: str) -> None:
         """Setup GUI theme and styling"""
+        global _resolved_theme
         style = ttk.Style()
-        
-        # Try to use modern theme
-        available_themes = style.theme_names()
-        preferred_themes = ['vista', 'clam', 'alt', 'default']
-        
-        selected_theme = 'default'
-        for theme in preferred_themes:
-            if theme in available_themes:
-                selected_theme = theme
-                break
-        
-        style.theme_use(selected_theme)
-        
-        # Custom styling
-        style.configure('Title.TLabel', font=('Arial', 12, 'bold'))
-        style.configure('Heading.TLabel', font=('Arial', 10, 'bold'))
-        style.configure('Success.TLabel', foreground='green')
-        style.configure('Error.TLabel', foreground='red')
-        style.configure('Warning.TLabel', foreground='orange')
-        
-        # Configure colors based on theme preference
-        theme_pref = config.get('gui.theme', 'light')
+
+        # Resolve the preferred theme once per process and cache it in
+        # a module-level variable, so later window setups skip the
+        # theme_names() probe loop without touching the config store
+        if _resolved_theme is None:
+            available_themes = style.theme_names()
+            preferred_themes = ['vista', 'clam', 'alt', 'default']
+
+            _resolved_theme = 'default'
+            for theme in preferred_themes:
+                if theme in available_themes:
+                    _resolved_theme = theme
+                    break
+
+        style.theme_use(_resolved_theme)
+
+        # Custom styling, batched into single Tcl evals
+        self.root.tk.eval(_BASE_STYLE_SCRIPT)
         if theme_pref == 'dark':
-            # Configure dark theme colors
-            style.configure('TFrame', background='#2d2d2d')
-            style.configure('TLabel', background='#2d2d2d', foreground='white')
-            style.configure('TNotebook', background='#2d2d2d')
-            style.configure('TNotebook.Tab', background='#404040', foreground='white')
+            self.root.tk.eval(_DARK_STYLE_SCRIPT)
     
     def _create_menu_bar(self) -> None:
         """Create application menu bar"""
@@ -157,46 +221,88 @@ class DeodexerProGUI:
         self.root.bind('<F11>', lambda e: self._toggle_fullscreen())
     
     def _create_tabs(self) -> None:
-        """Create main application tabs"""
-        # Dashboard tab
+        """Create main application tabs (non-default tabs build lazily)"""
+        # Dashboard tab stays eager since it's the default view
         self.dashboard_frame = DashboardFrame(self.notebook, self.db_manager)
         self.notebook.add(self.dashboard_frame, text="Dashboard")
-        
-        # Job Manager tab
-        self.job_manager_frame = JobManagerFrame(self.notebook, self.engine, self.db_manager)
-        self.notebook.add(self.job_manager_frame, text="Job Manager")
-        
-        # File Browser tab
-        self.file_browser_frame = FileBrowserFrame(self.notebook)
-        self.notebook.add(self.file_browser_frame, text="File Browser")
-        
-        # Progress Monitor tab
-        self.progress_monitor_frame = ProgressMonitorFrame(self.notebook, self.db_manager)
-        self.notebook.add(self.progress_monitor_frame, text="Progress Monitor")
-        
-        # Settings tab
-        self.settings_frame = SettingsFrame(self.notebook, config)
-        self.notebook.add(self.settings_frame, text="Settings")
-        
+
+        # Remaining tabs start as empty placeholders and are built on
+        # first selection, so startup doesn't pay for unshown widgets or
+        # their module imports
+        from .components.simple_components import (
+            JobManagerFrame, ProgressMonitorFrame, SettingsFrame, FileBrowserFrame
+        )
+        self._tab_titles = ["Dashboard", "Job Manager", "File Browser",
+                           "Progress Monitor", "Settings"]
+        self._tab_factories = [
+            None,  # Dashboard built above
+            lambda parent: JobManagerFrame(parent, self.engine, self.db_manager,
+                                           on_jobs_changed=self.mark_stats_dirty),
+            lambda parent: FileBrowserFrame(parent),
+            lambda parent: ProgressMonitorFrame(parent, self.db_manager),
+            lambda parent: SettingsFrame(parent, config),
+        ]
+        self._tab_frames = [self.dashboard_frame, None, None, None, None]
+        for title in self._tab_titles[1:]:
+            self.notebook.add(ttk.Frame(self.notebook), text=title)
+
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         # Set initial tab
         self.notebook.select(0)
+
+    def _ensure_tab(self, index: int) -> ttk.Frame:
+        """Build a lazily-constructed tab on first use and return its frame"""
+        frame = self._tab_frames[index]
+        if frame is None:
+            placeholder = self.notebook.tabs()[index]
+            selected = self.notebook.select() == placeholder
+            frame = self._tab_factories[index](self.notebook)
+            self._tab_frames[index] = frame
+            self.notebook.insert(index, frame, text=self._tab_titles[index])
+            self.notebook.forget(placeholder)
+            if selected:
+                self.notebook.select(index)
+        return frame
+
+    def _on_tab_changed(self, event) -> None:
+        """Build the selected tab's real frame on first visit"""
+        self._ensure_tab(self.notebook.index('current'))
+
+    @property
+    def job_manager_frame(self) -> ttk.Frame:
+        return self._ensure_tab(1)
+
+    @property
+    def file_browser_frame(self) -> ttk.Frame:
+        return self._ensure_tab(2)
+
+    @property
+    def progress_monitor_frame(self) -> ttk.Frame:
+        return self._ensure_tab(3)
+
+    @property
+    def settings_frame(self) -> ttk.Frame:
+        return self._ensure_tab(4)
     
     def _create_status_bar(self) -> None:
         """Create status bar at bottom of window"""
         self.status_frame = ttk.Frame(self.root)
         self.status_frame.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Status label
+        # Single combined status label: message, job count and memory share
+        # one StringVar so each update is one Tcl variable trace
+        self._status_message = "Ready"
+        self._jobs_count = 0
         self.status_var = tk.StringVar()
-        self.status_var.set("Ready")
         self.status_label = ttk.Label(
-            self.status_frame, 
+            self.status_frame,
             textvariable=self.status_var,
             relief=tk.SUNKEN,
             anchor=tk.W
         )
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2, pady=2)
-        
+
         # Progress bar (hidden by default)
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(
@@ -204,64 +310,186 @@ class DeodexerProGUI:
             variable=self.progress_var,
             maximum=100
         )
-        
-        # System info labels
-        self.system_info_frame = ttk.Frame(self.status_frame)
-        self.system_info_frame.pack(side=tk.RIGHT, padx=2, pady=2)
-        
-        self.jobs_label = ttk.Label(self.system_info_frame, text="Jobs: 0")
-        self.jobs_label.pack(side=tk.RIGHT, padx=5)
-        
-        self.memory_label = ttk.Label(self.system_info_frame, text="Memory: 0%")
-        self.memory_label.pack(side=tk.RIGHT, padx=5)
-        
+
+        # Coalesced status updates: latest message/progress pair, flushed at
+        # most once per frame
+        self._status_pending = ("Ready", None)
+        self._status_flush_id = None
+        self._progress_visible = False
+
+        # Periodic refresh state: pause while iconified, query the DB only
+        # when job state changed, and memoize the memory sample
+        self._system_info_paused = False
+        self._stats_dirty = True
+        self._stats_fallback_ticks = 0
+        # Single owner of the periodic after() chain; unmap cancels it
+        # so minimize/restore cycles cannot spawn parallel chains
+        self._system_info_after_id = None
+        self._memory_sample = (0.0, 0.0)  # (sampled_at, percent)
+        self.root.bind('<Unmap>', self._on_window_unmap, add='+')
+        self.root.bind('<Map>', self._on_window_map, add='+')
+
+        self._render_status()
+
         # Update system info periodically
         self._update_system_info()
+
+    def _render_status(self) -> None:
+        """Write the combined status line in a single variable update"""
+        self.status_var.set(_STATUS_TEMPLATE.format(
+            self._status_message, self._jobs_count, self._sample_memory_percent()
+        ))
     
-    def _setup_event_loop(self) -> None:
-        """Setup asyncio event loop for async operations"""
-        self.loop = asyncio.new_event_loop()
-        self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
-        self.loop_thread.start()
-    
-    def _run_event_loop(self) -> None:
-        """Run asyncio event loop in separate thread"""
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Background asyncio loop, created with its thread on first use"""
+        if self._loop is None:
+            ready = threading.Event()
+            self._loop_thread = threading.Thread(
+                target=self._run_event_loop, args=(ready,), daemon=True
+            )
+            self._loop_thread.start()
+            ready.wait()
+        return self._loop
+
+    def _run_event_loop(self, ready: threading.Event) -> None:
+        """Run a context-managed asyncio.Runner in a background thread
+
+        The Runner owns loop creation and teardown: when _on_closing
+        stops the loop, leaving the with-block cancels leftover tasks,
+        closes async generators and closes the loop instead of leaking it.
+        """
+        with asyncio.Runner(loop_factory=_new_background_loop) as runner:
+            self._loop = runner.get_loop()
+            ready.set()
+            self._loop.run_forever()
+        self._loop = None
     
     def _update_system_info(self) -> None:
         """Update system information in status bar"""
+        self._system_info_after_id = None
+        if self._system_info_paused:
+            return  # The <Map> handler restarts the timer on deiconify
+
         try:
-            # Get job statistics
-            stats = self.db_manager.get_job_statistics()
-            active_jobs = stats.get('running_jobs', 0)
-            self.jobs_label.config(text=f"Jobs: {active_jobs}")
-            
-            # Get memory usage (simplified)
-            import psutil
-            memory_percent = psutil.virtual_memory().percent
-            self.memory_label.config(text=f"Memory: {memory_percent:.1f}%")
-            
+            # Only hit the database when job state changed since last query,
+            # and do it on the asyncio loop so the Tk thread never blocks.
+            # A slow fallback re-queries once a minute regardless, in case
+            # a job path forgets to call mark_stats_dirty
+            self._stats_fallback_ticks += 1
+            if self._stats_dirty or self._stats_fallback_ticks >= 12:
+                self._stats_dirty = False
+                self._stats_fallback_ticks = 0
+                future = asyncio.run_coroutine_threadsafe(self._fetch_stats(), self.loop)
+                future.add_done_callback(
+                    lambda f: self.root.after(0, self._apply_stats, f)
+                )
+
+            # Refresh the memory readout (memoized sample)
+            self._render_status()
+
         except Exception as e:
             logger.error("Failed to update system info", error=str(e))
-        
+
         # Schedule next update
-        self.root.after(5000, self._update_system_info)  # Update every 5 seconds
+        self._system_info_after_id = self.root.after(
+            5000, self._update_system_info)  # Update every 5 seconds
+
+    async def _fetch_stats(self) -> Dict[str, Any]:
+        """Fetch job statistics without blocking the asyncio loop"""
+        return await asyncio.to_thread(self.db_manager.get_job_statistics)
+
+    def _apply_stats(self, future) -> None:
+        """Apply fetched job statistics to the status bar (Tk thread)"""
+        try:
+            stats = future.result()
+            self._jobs_count = stats.get('running_jobs', 0)
+            self._render_status()
+        except Exception as e:
+            logger.error("Failed to update job statistics", error=str(e))
+
+    def mark_stats_dirty(self) -> None:
+        """Flag that job statistics changed and should be re-queried"""
+        self._stats_dirty = True
+
+    def _sample_memory_percent(self) -> float:
+        """Get memory usage percent, memoized for 5 seconds"""
+        if psutil is None:
+            return 0.0
+        sampled_at, percent = self._memory_sample
+        now = time.monotonic()
+        if now - sampled_at >= 5.0:
+            percent = psutil.virtual_memory().percent
+            self._memory_sample = (now, percent)
+        return percent
+
+    def _on_window_unmap(self, event) -> None:
+        """Pause periodic updates while the window is iconified"""
+        if event.widget is self.root:
+            self._system_info_paused = True
+            if self._system_info_after_id is not None:
+                self.root.after_cancel(self._system_info_after_id)
+                self._system_info_after_id = None
+
+    def _on_window_map(self, event) -> None:
+        """Resume periodic updates when the window reappears"""
+        if event.widget is self.root and self._system_info_paused:
+            self._system_info_paused = False
+            if self._system_info_after_id is None:
+                self._system_info_after_id = self.root.after(
+                    0, self._update_system_info)
     
     def update_status(self, message: str, progress: Optional[float] = None) -> None:
-        """Update status bar message and optional progress"""
-        self.status_var.set(message)
-        
+        """Update status bar message and optional progress (coalesced)"""
+        # Store only the latest update; a single ~60 Hz flush writes it out,
+        # so rapid progress callbacks don't trigger per-call relayouts
+        self._status_pending = (message, progress)
+        if self._status_flush_id is None:
+            self._status_flush_id = self.root.after(16, self._flush_status)
+
+    def _flush_status(self) -> None:
+        """Write the most recent pending status to the widgets"""
+        self._status_flush_id = None
+        message, progress = self._status_pending
+        self._status_message = message
+        self._render_status()
+
         if progress is not None:
             self.progress_var.set(progress)
-            if not self.progress_bar.winfo_viewable():
+            if not self._progress_visible:
+                self._progress_visible = True
                 self.progress_bar.pack(side=tk.RIGHT, padx=5, pady=2)
-        else:
-            if self.progress_bar.winfo_viewable():
-                self.progress_bar.pack_forget()
-        
-        self.root.update_idletasks()
+        elif self._progress_visible:
+            self._progress_visible = False
+            self.progress_var.set(0)
+            self.progress_bar.pack_forget()
     
+    def _begin_indeterminate(self, message: str) -> None:
+        """Show an indeterminate progress bar while a background task runs"""
+        self._status_message = message
+        self._render_status()
+        self.progress_bar.configure(mode='indeterminate')
+        if not self._progress_visible:
+            self._progress_visible = True
+            self.progress_bar.pack(side=tk.RIGHT, padx=5, pady=2)
+        self.progress_bar.start(10)
+
+    def _end_indeterminate(self) -> None:
+        """Stop and hide the indeterminate progress bar"""
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode='determinate')
+        if self._progress_visible:
+            self._progress_visible = False
+            self.progress_bar.pack_forget()
+
+    def post_progress(self, message: str, progress: Optional[float] = None) -> None:
+        """Deliver a progress update safely from the asyncio loop or a worker
+
+        Tk widgets must only be touched from the Tk thread, so cross-thread
+        callers route through root.after instead of mutating widgets directly.
+        """
+        self.root.after(0, self.update_status, message, progress)
+
     def show_error(self, title: str, message: str) -> None:
         """Show error dialog"""
         messagebox.showerror(title, message)
@@ -277,6 +505,19 @@ class DeodexerProGUI:
         messagebox.showinfo(title, message)
         logger.info("GUI Info", title=title, message=message)
     
+    def _submit_io(self, func, *args, on_done) -> None:
+        """Run blocking file I/O on the shared executor with a busy cursor"""
+        self.root.config(cursor='watch')
+        future = self._io_executor.submit(func, *args)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_io, f, on_done)
+        )
+
+    def _finish_io(self, future, on_done) -> None:
+        """Restore the cursor and hand the finished future back (Tk thread)"""
+        self.root.config(cursor='')
+        on_done(future)
+
     # Menu command implementations
     def _new_job(self) -> None:
         """Create new deodexing job"""
@@ -288,16 +529,31 @@ class DeodexerProGUI:
         # Implementation for opening saved job configurations
         file_path = filedialog.askopenfilename(
             title="Open Job Configuration",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"),
+                       ("Compressed JSON files", "*.json.gz"),
+                       ("All files", "*.*")]
         )
         if file_path:
-            try:
-                with open(file_path, 'r') as f:
-                    job_config = json.load(f)
-                self.job_manager_frame.load_job_config(job_config)
-                self.update_status(f"Loaded job configuration: {Path(file_path).name}")
-            except Exception as e:
-                self.show_error("Error", f"Failed to load job configuration: {str(e)}")
+            self._submit_io(self._read_job_config, file_path,
+                            on_done=lambda f: self._finish_open_job(f, file_path))
+
+    @staticmethod
+    def _read_job_config(file_path: str) -> Dict[str, Any]:
+        """Read a job configuration file (runs on the I/O executor)"""
+        if file_path.endswith('.gz'):
+            import gzip
+            with gzip.open(file_path, 'rt') as f:
+                return json.load(f)
+        with open(file_path, 'r') as f:
+            return json.load(f)
+
+    def _finish_open_job(self, future, file_path: str) -> None:
+        """Apply a loaded job configuration on the Tk thread"""
+        try:
+            self.job_manager_frame.load_job_config(future.result())
+            self.update_status(f"Loaded job configuration: {Path(file_path).name}")
+        except Exception as e:
+            self.show_error("Error", f"Failed to load job configuration: {str(e)}")
     
     def _save_job(self) -> None:
         """Save current job configuration"""
@@ -309,15 +565,36 @@ class DeodexerProGUI:
         file_path = filedialog.asksaveasfilename(
             title="Save Job Configuration",
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"),
+                       ("Compressed JSON files", "*.json.gz"),
+                       ("All files", "*.*")]
         )
         if file_path:
-            try:
-                with open(file_path, 'w') as f:
-                    json.dump(config_data, f, indent=2)
-                self.update_status(f"Saved job configuration: {Path(file_path).name}")
-            except Exception as e:
-                self.show_error("Error", f"Failed to save job configuration: {str(e)}")
+            self._submit_io(self._write_job_config, file_path, config_data,
+                            on_done=lambda f: self._finish_save_job(f, file_path))
+
+    @staticmethod
+    def _write_job_config(file_path: str, config_data: Dict[str, Any]) -> None:
+        """Write a job configuration file (runs on the I/O executor)
+
+        Compact separators skip the pretty-print string building; a
+        .json.gz target adds near-memcpy-speed compression.
+        """
+        if file_path.endswith('.gz'):
+            import gzip
+            with gzip.open(file_path, 'wt', compresslevel=1) as f:
+                json.dump(config_data, f, separators=(',', ':'))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(config_data, f, separators=(',', ':'))
+
+    def _finish_save_job(self, future, file_path: str) -> None:
+        """Report the outcome of a job configuration save (Tk thread)"""
+        try:
+            future.result()
+            self.update_status(f"Saved job configuration: {Path(file_path).name}")
+        except Exception as e:
+            self.show_error("Error", f"Failed to save job configuration: {str(e)}")
     
     def _import_config(self) -> None:
         """Import application configuration"""
@@ -325,21 +602,51 @@ class DeodexerProGUI:
             title="Import Configuration",
             filetypes=[("YAML files", "*.yaml"), ("JSON files", "*.json"), ("All files", "*.*")]
         )
-        if file_path:
+        if not file_path:
+            return
+
+        # Parse on the asyncio loop's worker thread so large configs never
+        # block the Tk main loop; resume on the Tk thread once parsed
+        self._begin_indeterminate("Importing configuration...")
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.to_thread(self._parse_config_file, file_path), self.loop
+        )
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._finish_import_config, f)
+        )
+
+    @staticmethod
+    def _parse_config_file(file_path: str) -> Dict[str, Any]:
+        """Parse a YAML or JSON configuration file (runs off the Tk thread)"""
+        if file_path.endswith('.yaml'):
+            import yaml
             try:
-                if file_path.endswith('.yaml'):
-                    import yaml
-                    with open(file_path, 'r') as f:
-                        config_data = yaml.safe_load(f)
-                else:
-                    with open(file_path, 'r') as f:
-                        config_data = json.load(f)
-                
-                config.update(config_data)
-                self.settings_frame.refresh_settings()
-                self.update_status("Configuration imported successfully")
-            except Exception as e:
-                self.show_error("Error", f"Failed to import configuration: {str(e)}")
+                from yaml import CSafeLoader as YamlLoader  # libyaml backend
+            except ImportError:
+                from yaml import SafeLoader as YamlLoader
+            with open(file_path, 'rb') as f:
+                return yaml.load(f, Loader=YamlLoader)
+
+        with open(file_path, 'rb') as f:
+            if orjson is not None and os.fstat(f.fileno()).st_size > (1 << 20):
+                # Memory-map large files so orjson parses the pages
+                # directly instead of a second copy
+                import mmap
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            elif orjson is not None:
+                return orjson.loads(f.read())
+            return json.load(f)
+
+    def _finish_import_config(self, future) -> None:
+        """Apply an imported configuration on the Tk thread"""
+        self._end_indeterminate()
+        try:
+            config.update(future.result())
+            self.settings_frame.refresh_settings()
+            self.update_status("Configuration imported successfully")
+        except Exception as e:
+            self.show_error("Error", f"Failed to import configuration: {str(e)}")
     
     def _export_config(self) -> None:
         """Export current configuration"""
@@ -349,19 +656,35 @@ class DeodexerProGUI:
             filetypes=[("YAML files", "*.yaml"), ("JSON files", "*.json"), ("All files", "*.*")]
         )
         if file_path:
+            self._submit_io(self._write_config_file, file_path, dict(config.to_dict()),
+                            on_done=self._finish_export_config)
+
+    @staticmethod
+    def _write_config_file(file_path: str, config_data: Dict[str, Any]) -> None:
+        """Write a configuration file (runs on the I/O executor)"""
+        if file_path.endswith('.yaml'):
+            import yaml
             try:
-                config_data = config.to_dict()
-                if file_path.endswith('.yaml'):
-                    import yaml
-                    with open(file_path, 'w') as f:
-                        yaml.dump(config_data, f, default_flow_style=False, indent=2)
-                else:
-                    with open(file_path, 'w') as f:
-                        json.dump(config_data, f, indent=2)
-                
-                self.update_status("Configuration exported successfully")
-            except Exception as e:
-                self.show_error("Error", f"Failed to export configuration: {str(e)}")
+                from yaml import CSafeDumper as YamlDumper  # libyaml backend
+            except ImportError:
+                from yaml import SafeDumper as YamlDumper
+            with open(file_path, 'w') as f:
+                yaml.dump(config_data, f, Dumper=YamlDumper,
+                          default_flow_style=False, indent=2)
+        elif orjson is not None:
+            with open(file_path, 'wb') as f:
+                f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(file_path, 'w') as f:
+                json.dump(config_data, f, indent=2)
+
+    def _finish_export_config(self, future) -> None:
+        """Report the outcome of a configuration export (Tk thread)"""
+        try:
+            future.result()
+            self.update_status("Configuration exported successfully")
+        except Exception as e:
+            self.show_error("Error", f"Failed to export configuration: {str(e)}")
     
     def _refresh_view(self) -> None:
         """Refresh current view"""
@@ -412,9 +735,12 @@ Developed by: {config.get('app.author', 'WiredTourqe')}
                 # Cleanup any running operations
                 pass
             
-            # Stop event loop
-            if hasattr(self, 'loop'):
-                self.loop.call_soon_threadsafe(self.loop.stop)
+            # Let queued dialog I/O finish in the background
+            self._io_executor.shutdown(wait=False)
+
+            # Stop event loop (only if something actually started it)
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
             
             logger.info("Application closing")
             self.root.quit()
@@ -2,22 +2,54 @@
 Main entry point for Deodexer Pro application
 """
 
+import os
 import sys
 import argparse
 import asyncio
+import time
 from pathlib import Path
+from typing import Optional
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src directory to Python path (cheap os.path resolution, and only
+# when running from a checkout where it is not already importable)
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
 from deodexer_pro.core.config import config
 from deodexer_pro.core.logger import logger
-from deodexer_pro.core.deodexer import DeodexerEngine
-from deodexer_pro.database.manager import DatabaseManager
+
+
+# Parser is built once and reused across repeated invocations
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+# Progress line preformatted once; the callback only fills the counters in,
+# skipping the per-call kwargs dict and context join in the logger
+_PROGRESS_TEMPLATE = "Progress | completed={} | total={}"
+
+
+def _make_progress_logger():
+    """Build a progress callback throttled to one log line per second"""
+    last = [0.0]
+
+    def log_progress(progress):
+        completed = progress['completed']
+        total = progress['total']
+        now = time.monotonic()
+        if now - last[0] < 1.0 and completed != total:
+            return
+        last[0] = now
+        logger.info(_PROGRESS_TEMPLATE.format(completed, total))
+
+    return log_progress
 
 
 def create_arg_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser"""
+    """Create command line argument parser (cached after first build)"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
     parser = argparse.ArgumentParser(
         description="Deodexer Pro - Advanced Android Deodexer",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -55,17 +87,21 @@ Examples:
     batch_parser.add_argument('--config', help='Configuration file path')
     batch_parser.add_argument('--input', required=True, help='Input directory')
     batch_parser.add_argument('--output', default='batch_output', help='Output directory')
-    
+
+    _PARSER = parser
     return parser
 
 
 async def run_cli_command(args) -> int:
     """Run CLI deodexing command"""
     try:
-        logger.info("Starting CLI deodexing", 
+        # Imported here so `gui` startup never pays for the engine stack
+        from deodexer_pro.core.deodexer import DeodexerEngine
+
+        logger.info("Starting CLI deodexing",
                    input_dir=args.input_dir,
                    output_dir=args.output_dir)
-        
+
         # Initialize engine
         engine = DeodexerEngine()
         
@@ -86,11 +122,7 @@ async def run_cli_command(args) -> int:
             output_dir=args.output_dir,
             api_level=args.api_level,
             max_workers=args.max_workers,
-            progress_callback=lambda progress: logger.info(
-                "Progress", 
-                completed=progress['completed'],
-                total=progress['total']
-            )
+            progress_callback=_make_progress_logger()
         )
         
         # Generate report
@@ -152,6 +184,10 @@ def run_api_command(args) -> int:
 async def run_batch_command(args) -> int:
     """Run batch processing"""
     try:
+        # Imported here so other commands never pay for the engine stack
+        from deodexer_pro.core.deodexer import DeodexerEngine
+        from deodexer_pro.database.manager import DatabaseManager
+
         logger.info("Starting batch processing", input_dir=args.input)
         
         # Load configuration if provided
@@ -191,14 +227,25 @@ async def run_batch_command(args) -> int:
 
 def main():
     """Main entry point"""
+    # Prefer uvloop's faster event loop for the async CLI paths
     try:
-        # Parse arguments
-        parser = create_arg_parser()
-        args = parser.parse_args()
-        
-        if not args.command:
-            parser.print_help()
-            return 1
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    try:
+        # Parse arguments; the bare `gui` invocation is common enough to
+        # skip argparse construction entirely
+        if sys.argv[1:] == ['gui']:
+            args = argparse.Namespace(command='gui', theme=None)
+        else:
+            parser = create_arg_parser()
+            args = parser.parse_args()
+
+            if not args.command:
+                parser.print_help()
+                return 1
         
         # Initialize configuration and logging
         logger.info("Deodexer Pro starting", 
@@ -215,7 +262,7 @@ def main():
         elif args.command == 'batch':
             return asyncio.run(run_batch_command(args))
         else:
-            parser.print_help()
+            create_arg_parser().print_help()
             return 1
             
     except KeyboardInterrupt:
@@ -3,14 +3,143 @@ Machine Learning optimization module for deodexing operations
 """
 
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple
+import functools
 import pickle
 import os
+import time
 from pathlib import Path
+from types import MappingProxyType
+
+# Imported once at module scope; per-call imports are slow on hot paths
+try:
+    import psutil
+except ImportError:
+    psutil = None
 
 from ..core.logger import logger
 from ..core.config import config
 
+# Optional JIT backend for the per-file decision kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Encodings for the decision kernel, which works on plain numbers so the
+# numba backend can compile it; the wrapper maps codes back to values
+_MEMORY_LIMITS = ('256M', '512M', '1G', '2G')
+_PRIORITIES = ('low', 'normal', 'high')
+_FLAG_THREADS = 1
+_FLAG_VERIFY_NONE = 2
+
+_COMPLEXITY_MAP = {'low': 0.2, 'medium': 0.5, 'high': 0.8}
+
+# Immutable default-parameter template; callers get a fresh dict with
+# its own flags list, so extending the flags never aliases shared state
+_DEFAULT_PARAMS = MappingProxyType({
+    'memory_limit': '1G',
+    'thread_priority': 'normal',
+    'max_concurrent': 4,
+    'timeout_multiplier': 1.0,
+    'optimization_applied': False
+})
+
+
+def _predict_core(file_size_norm, cpu_load, memory_load, complexity):
+    """Scalar decision kernel for parameter prediction
+
+    Returns (memory_code, priority_code, max_concurrent,
+    timeout_multiplier, flags_mask) as plain numbers; compiled to
+    machine code when numba is installed.
+    """
+    memory_code = 2      # '1G'
+    priority_code = 1    # 'normal'
+    max_concurrent = 4
+    timeout_multiplier = 1.0
+    flags_mask = 0
+
+    # Adjust based on file size
+    if file_size_norm > 0.7:  # Large file
+        memory_code = 3
+        priority_code = 2
+        flags_mask |= _FLAG_THREADS  # Use 2 threads for large files
+    elif file_size_norm < 0.2:  # Small file
+        memory_code = 1
+        priority_code = 1
+
+    # Adjust based on system load
+    if cpu_load > 0.8 or memory_load > 0.8:  # High system load
+        max_concurrent = 1
+        priority_code = 0
+        memory_code = 0
+    elif cpu_load < 0.3 and memory_load < 0.3:  # Low system load
+        max_concurrent = 4
+        priority_code = 2
+
+    # Adjust based on complexity
+    if complexity > 0.7:  # High complexity
+        timeout_multiplier = 2.0
+        flags_mask |= _FLAG_VERIFY_NONE  # Skip verification for speed
+
+    return memory_code, priority_code, max_concurrent, timeout_multiplier, flags_mask
+
+
+@functools.lru_cache(maxsize=1)
+def _system_load_sample(time_bucket: int) -> Tuple[float, float]:
+    """Sample (cpu_load, memory_load) fractions, memoized per second
+
+    Every file in a batch would otherwise issue its own pair of psutil
+    syscalls — and cpu_percent() with no interval measures the delta
+    since the previous call, so per-file calls also skew the reading.
+    """
+    if psutil is None:
+        return 0.5, 0.5
+    try:
+        return (psutil.cpu_percent() / 100.0,
+                psutil.virtual_memory().percent / 100.0)
+    except Exception:
+        return 0.5, 0.5
+
+
+if njit is not None:
+    # Explicit signature compiles at declaration time instead of on the
+    # first batch call, and cache=True persists the artifact so the
+    # compile cost is paid once per install, not per process
+    from numba import types as _nb_types
+    _predict_signature = _nb_types.Tuple((
+        _nb_types.int64, _nb_types.int64, _nb_types.int64,
+        _nb_types.float64, _nb_types.int64
+    ))(_nb_types.float64, _nb_types.float64, _nb_types.float64, _nb_types.float64)
+    _predict_core = njit(_predict_signature, cache=True)(_predict_core)
+
+
+def warmup() -> None:
+    """Exercise the decision kernel once with dummy inputs
+
+    Run this after installation (or from a deploy script) so the cached
+    machine code exists before the first real batch; without numba it is
+    a single cheap Python call.
+    """
+    _predict_core(0.5, 0.5, 0.5, 0.5)
+
+
+@dataclass(slots=True)
+class LearningRecord:
+    """Compact learning sample kept in the debug trail
+
+    Only the fields the model update actually reads are stored; the old
+    records nested the full file_info/parameters/result dicts, costing a
+    few KB of dict overhead per sample.
+    """
+    file_size_mb: float
+    complexity: float
+    duration: float
+    efficiency: float
+    success: bool
+    timestamp: float
+
 
 class DeodexingOptimizer:
     """Machine learning-based optimization for deodexing parameters"""
@@ -19,7 +148,21 @@ class DeodexingOptimizer:
         self.model_path = config.get('ml.model_path', 'data/models/')
         self.enabled = config.get('ml.enabled', True)
         self.prediction_threshold = config.get('ml.prediction_threshold', 0.8)
-        self.optimization_history = []
+        self.optimization_history = []  # bounded debug trail (latest records)
+
+        # SoA ring buffers for the learning history: stats reduce over
+        # these with vectorized numpy ops instead of walking record dicts
+        self._history_capacity = 1000
+        self._eff = np.zeros(self._history_capacity, dtype=np.float32)
+        self._dur = np.zeros(self._history_capacity, dtype=np.float32)
+        self._success = np.zeros(self._history_capacity, dtype=bool)
+        self._n = 0
+
+        # Running aggregates kept in step with the ring writes, so stats
+        # queries read counters instead of re-reducing the window
+        self._sum_efficiency = 0.0
+        self._sum_duration = 0.0
+        self._success_count = 0
         
         # Feature weights for optimization
         self.feature_weights = {
@@ -83,56 +226,40 @@ class DeodexingOptimizer:
         features['file_size_norm'] = min(file_size_mb / 100.0, 1.0)  # Normalize to 0-1
         
         # Complexity feature
-        complexity_map = {'low': 0.2, 'medium': 0.5, 'high': 0.8}
-        features['complexity'] = complexity_map.get(file_info.get('complexity', 'medium'), 0.5)
+        features['complexity'] = _COMPLEXITY_MAP.get(file_info.get('complexity', 'medium'), 0.5)
         
         # Estimated processing time (normalized)
         est_time = file_info.get('estimated_time', 30.0)
         features['est_time_norm'] = min(est_time / 300.0, 1.0)  # Normalize to 0-1 (max 5 min)
         
-        # System load (simplified)
-        try:
-            import psutil
-            features['cpu_load'] = psutil.cpu_percent() / 100.0
-            features['memory_load'] = psutil.virtual_memory().percent / 100.0
-        except Exception:
-            features['cpu_load'] = 0.5
-            features['memory_load'] = 0.5
-        
+        # System load (shared 1-second sample across the batch)
+        cpu_load, memory_load = _system_load_sample(int(time.time()))
+        features['cpu_load'] = cpu_load
+        features['memory_load'] = memory_load
+
         return features
     
     def _predict_optimal_parameters(self, features: Dict[str, float]) -> Dict[str, Any]:
         """Predict optimal parameters using the ML model"""
-        # Rule-based optimization (placeholder for ML model)
+        # Rule-based decision kernel (placeholder for ML model)
+        memory_code, priority_code, max_concurrent, timeout_multiplier, flags_mask = \
+            _predict_core(
+                features.get('file_size_norm', 0.0),
+                features.get('cpu_load', 0.5),
+                features.get('memory_load', 0.5),
+                features.get('complexity', 0.5)
+            )
+
         params = self._get_default_parameters()
-        
-        # Adjust based on file size
-        if features.get('file_size_norm', 0) > 0.7:  # Large file
-            params['memory_limit'] = '2G'
-            params['thread_priority'] = 'high'
-            params['baksmali_flags'].extend(['-j', '2'])  # Use 2 threads for large files
-        elif features.get('file_size_norm', 0) < 0.2:  # Small file
-            params['memory_limit'] = '512M'
-            params['thread_priority'] = 'normal'
-        
-        # Adjust based on system load
-        cpu_load = features.get('cpu_load', 0.5)
-        memory_load = features.get('memory_load', 0.5)
-        
-        if cpu_load > 0.8 or memory_load > 0.8:  # High system load
-            params['max_concurrent'] = 1
-            params['thread_priority'] = 'low'
-            params['memory_limit'] = '256M'
-        elif cpu_load < 0.3 and memory_load < 0.3:  # Low system load
-            params['max_concurrent'] = 4
-            params['thread_priority'] = 'high'
-        
-        # Adjust based on complexity
-        complexity = features.get('complexity', 0.5)
-        if complexity > 0.7:  # High complexity
-            params['timeout_multiplier'] = 2.0
-            params['baksmali_flags'].append('--verify-none')  # Skip verification for speed
-        
+        params['memory_limit'] = _MEMORY_LIMITS[memory_code]
+        params['thread_priority'] = _PRIORITIES[priority_code]
+        params['max_concurrent'] = max_concurrent
+        params['timeout_multiplier'] = timeout_multiplier
+        if flags_mask & _FLAG_THREADS:
+            params['baksmali_flags'].extend(['-j', '2'])
+        if flags_mask & _FLAG_VERIFY_NONE:
+            params['baksmali_flags'].append('--verify-none')
+
         return params
     
     def _apply_safety_constraints(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -156,14 +283,7 @@ class DeodexingOptimizer:
     
     def _get_default_parameters(self) -> Dict[str, Any]:
         """Get default optimization parameters"""
-        return {
-            'memory_limit': '1G',
-            'thread_priority': 'normal',
-            'max_concurrent': 4,
-            'timeout_multiplier': 1.0,
-            'baksmali_flags': [],
-            'optimization_applied': False
-        }
+        return {**_DEFAULT_PARAMS, 'baksmali_flags': []}
     
     def learn_from_result(self, file_info: Dict[str, Any], params: Dict[str, Any], 
                          result: Dict[str, Any]) -> None:
@@ -173,23 +293,42 @@ class DeodexingOptimizer:
         
         try:
             # Record the optimization result
-            learning_record = {
-                'file_info': file_info,
-                'parameters': params,
-                'result': result,
-                'success': result.get('status') == 'completed',
-                'duration': result.get('duration', 0),
-                'efficiency': self._calculate_efficiency(file_info, result)
-            }
-            
+            learning_record = LearningRecord(
+                file_size_mb=file_info.get('size_mb', 0.0),
+                complexity=_COMPLEXITY_MAP.get(file_info.get('complexity', 'medium'), 0.5),
+                duration=result.get('duration', 0),
+                efficiency=self._calculate_efficiency(file_info, result),
+                success=result.get('status') == 'completed',
+                timestamp=time.time()
+            )
+
+            # Write the numeric fields into the next ring slot, retiring
+            # the evicted sample's contribution from the running sums
+            slot = self._n % self._history_capacity
+            if self._n >= self._history_capacity and self._success[slot]:
+                self._sum_efficiency -= float(self._eff[slot])
+                self._sum_duration -= float(self._dur[slot])
+                self._success_count -= 1
+
+            self._eff[slot] = learning_record.efficiency
+            self._dur[slot] = learning_record.duration
+            self._success[slot] = learning_record.success
+            self._n += 1
+
+            if learning_record.success:
+                # Accumulate the float32-rounded stored values so later
+                # retirement subtracts exactly what was added
+                self._sum_efficiency += float(self._eff[slot])
+                self._sum_duration += float(self._dur[slot])
+                self._success_count += 1
+
+            # Keep only a short dict trail for debugging
             self.optimization_history.append(learning_record)
-            
-            # Keep only recent history to prevent memory bloat
-            if len(self.optimization_history) > 1000:
-                self.optimization_history = self.optimization_history[-500:]
-            
+            if len(self.optimization_history) > 50:
+                del self.optimization_history[0]
+
             # Trigger model retraining if we have enough data
-            if len(self.optimization_history) > 100:
+            if self._n > 100:
                 self._update_model()
             
         except Exception as e:
@@ -220,13 +359,20 @@ class DeodexingOptimizer:
             # For now, just update feature weights based on recent performance
             
             recent_records = self.optimization_history[-50:]  # Last 50 records
-            successful_records = [r for r in recent_records if r['success']]
-            
-            if len(successful_records) < 10:
+
+            # Single pass: count successes and sum efficiency together
+            successful = 0
+            total_efficiency = 0.0
+            for record in recent_records:
+                if record.success:
+                    successful += 1
+                    total_efficiency += record.efficiency
+
+            if successful < 10:
                 return  # Not enough data
-            
+
             # Analyze which features correlate with better efficiency
-            avg_efficiency = sum(r['efficiency'] for r in successful_records) / len(successful_records)
+            avg_efficiency = total_efficiency / successful
             
             # Simple adaptive weight adjustment
             if avg_efficiency > 0.5:  # Good performance
@@ -253,21 +399,22 @@ class DeodexingOptimizer:
     def get_optimization_stats(self) -> Dict[str, Any]:
         """Get optimization statistics and performance metrics"""
         try:
-            if not self.optimization_history:
+            total_optimizations = min(self._n, self._history_capacity)
+            if total_optimizations == 0:
                 return {'total_optimizations': 0}
-            
-            total_optimizations = len(self.optimization_history)
-            successful_optimizations = sum(1 for r in self.optimization_history if r['success'])
-            
+
+            # O(1) reads of the running aggregates
+            successful_optimizations = self._success_count
+
             if successful_optimizations == 0:
                 return {
                     'total_optimizations': total_optimizations,
                     'success_rate': 0.0
                 }
-            
-            avg_efficiency = sum(r['efficiency'] for r in self.optimization_history if r['success']) / successful_optimizations
-            avg_duration = sum(r['duration'] for r in self.optimization_history if r['success']) / successful_optimizations
-            
+
+            avg_efficiency = self._sum_efficiency / successful_optimizations
+            avg_duration = self._sum_duration / successful_optimizations
+
             return {
                 'total_optimizations': total_optimizations,
                 'successful_optimizations': successful_optimizations,
@@ -0,0 +1,55 @@
+"""
+Platform-specific directory enumeration helpers
+
+Exposes list_directory(path) returning (name, is_dir, size, mtime) tuples.
+On macOS a getattrlistbulk(2) based implementation batches hundreds of
+entries per syscall; on Linux with the optional liburing wrapper the
+per-entry statx calls are batched through io_uring; everywhere else (or
+if the bulk call fails) it falls back to os.scandir.
+"""
+
+import os
+import sys
+
+_bulk_list_directory = None
+if sys.platform == 'darwin':
+    try:
+        from .getattrlistbulk_darwin import list_directory_bulk as _bulk_list_directory
+    except Exception:
+        _bulk_list_directory = None
+elif sys.platform.startswith('linux'):
+    try:
+        from .io_uring_statx_linux import list_directory_bulk as _bulk_list_directory
+    except Exception:
+        _bulk_list_directory = None
+
+
+def _scandir_list_directory(path, show_hidden):
+    """List directory entries using os.scandir (portable fallback)"""
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            # Filter on the name alone so hidden entries never pay a stat
+            if not show_hidden and entry.name.startswith('.'):
+                continue
+            try:
+                stat = entry.stat()
+                entries.append((entry.name, entry.is_dir(), stat.st_size, stat.st_mtime))
+            except (OSError, IOError):
+                # Skip inaccessible items
+                continue
+    return entries
+
+
+def list_directory(path, show_hidden=True):
+    """List directory entries as (name, is_dir, size, mtime) tuples"""
+    if _bulk_list_directory is not None:
+        try:
+            entries = _bulk_list_directory(path)
+        except Exception:
+            pass  # Fall back to scandir on any platform-call failure
+        else:
+            if not show_hidden:
+                entries = [e for e in entries if not e[0].startswith('.')]
+            return entries
+    return _scandir_list_directory(path, show_hidden)
@@ -0,0 +1,111 @@
+"""
+Bulk directory enumeration for macOS via getattrlistbulk(2)
+
+os.scandir still issues one fstatat per entry when .stat() is consulted.
+getattrlistbulk returns name, object type, size and modification time for
+up to hundreds of entries per kernel transition, which makes large
+directory listings significantly cheaper on Darwin.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+
+# Constants from <sys/attr.h>
+_ATTR_BIT_MAP_COUNT = 5
+_ATTR_CMN_NAME = 0x00000001
+_ATTR_CMN_OBJTYPE = 0x00000008
+_ATTR_CMN_MODTIME = 0x00000400
+_ATTR_CMN_RETURNED_ATTRS = 0x80000000
+_ATTR_FILE_TOTALSIZE = 0x00000002
+
+# fsobj_type_t value for directories (<sys/vnode.h>)
+_VDIR = 2
+
+_O_DIRECTORY = getattr(os, 'O_DIRECTORY', 0x100000)
+_BUF_SIZE = 64 * 1024
+
+
+class _AttrList(ctypes.Structure):
+    """struct attrlist from <sys/attr.h>"""
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+
+_libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+_libc.getattrlistbulk.restype = ctypes.c_int
+
+
+def list_directory_bulk(path):
+    """List directory entries as (name, is_dir, size, mtime) tuples"""
+    fd = os.open(path, os.O_RDONLY | _O_DIRECTORY)
+    entries = []
+    try:
+        attrlist = _AttrList(
+            bitmapcount=_ATTR_BIT_MAP_COUNT,
+            commonattr=(_ATTR_CMN_RETURNED_ATTRS | _ATTR_CMN_NAME |
+                        _ATTR_CMN_OBJTYPE | _ATTR_CMN_MODTIME),
+            fileattr=_ATTR_FILE_TOTALSIZE
+        )
+        buf = ctypes.create_string_buffer(_BUF_SIZE)
+        while True:
+            count = _libc.getattrlistbulk(
+                fd, ctypes.byref(attrlist), buf, _BUF_SIZE, 0
+            )
+            if count < 0:
+                raise OSError(ctypes.get_errno(), "getattrlistbulk failed", path)
+            if count == 0:
+                break
+            _parse_entries(buf.raw, count, entries)
+    finally:
+        os.close(fd)
+    return entries
+
+
+def _parse_entries(data, count, entries):
+    """Parse packed attribute records returned by getattrlistbulk"""
+    offset = 0
+    for _ in range(count):
+        length, = struct.unpack_from('<I', data, offset)
+        record = data[offset:offset + length]
+        pos = 4
+
+        # attribute_set_t describing which attributes were actually returned
+        returned = struct.unpack_from('<5I', record, pos)
+        returned_common, returned_file = returned[0], returned[3]
+        pos += 20
+
+        name = ''
+        is_dir = False
+        size = 0
+        mtime = 0.0
+
+        if returned_common & _ATTR_CMN_NAME:
+            # attrreference_t: offset is relative to the reference itself
+            name_off, name_len = struct.unpack_from('<iI', record, pos)
+            raw_name = record[pos + name_off:pos + name_off + name_len]
+            name = raw_name.split(b'\0', 1)[0].decode('utf-8', errors='surrogateescape')
+            pos += 8
+        if returned_common & _ATTR_CMN_OBJTYPE:
+            obj_type, = struct.unpack_from('<I', record, pos)
+            is_dir = (obj_type == _VDIR)
+            pos += 4
+        if returned_common & _ATTR_CMN_MODTIME:
+            seconds, nanoseconds = struct.unpack_from('<qq', record, pos)
+            mtime = seconds + nanoseconds / 1e9
+            pos += 16
+        if returned_file & _ATTR_FILE_TOTALSIZE:
+            size, = struct.unpack_from('<q', record, pos)
+            pos += 8
+
+        if name:
+            entries.append((name, is_dir, size, mtime))
+        offset += length
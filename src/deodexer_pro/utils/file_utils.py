@@ -3,13 +3,60 @@ File validation and analysis utilities
 """
 
 import os
+import functools
 import hashlib
+import mmap
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import struct
 
 from ..core.logger import logger
 
+# Optional hardware-accelerated hasher (SIMD tree hashing over an mmap)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_jar_cached(jar_path: str, mtime_ns: int, size: int) -> bool:
+    """Inspect a JAR's contents, memoized per (path, mtime, size)
+
+    The stat fields key the cache, so edits to the JAR invalidate the
+    entry automatically.
+    """
+    import zipfile
+    try:
+        with zipfile.ZipFile(jar_path, 'r') as jar:
+            # Check for baksmali-specific files
+            file_list = jar.namelist()
+            if any('baksmali' in f.lower() for f in file_list):
+                return True
+            if 'META-INF/MANIFEST.MF' in file_list:
+                return True
+    except zipfile.BadZipFile:
+        return False
+    return True
+
+
+# Common framework files; any one of these marks a valid directory
+_FRAMEWORK_FILES = frozenset(('framework.jar', 'core.jar', 'android.jar'))
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_framework_cached(framework_dir: str, mtime_ns: int) -> bool:
+    """Scan a framework directory for expected files, memoized per mtime"""
+    # scandir streams entries and exits on the first hit, instead of
+    # materializing the whole listing and looping over it twice
+    with os.scandir(framework_dir) as it:
+        for entry in it:
+            if entry.name in _FRAMEWORK_FILES or entry.name.endswith('.odex'):
+                return True
+    return False
+
 
 class FileValidator:
     """Advanced file validation for ODEX and related files"""
@@ -18,23 +65,32 @@ class FileValidator:
         # Note: python-magic removed for simplicity
         self.magic = None
     
-    def validate_odex_file(self, file_path: str) -> bool:
-        """Validate if file is a valid ODEX file"""
+    def validate_odex_file(self, file_path: str,
+                           stat_result: Optional[os.stat_result] = None) -> bool:
+        """Validate if file is a valid ODEX file
+
+        Batch callers can pass a cached stat_result (e.g. from
+        DirEntry.stat()) to skip the extra syscall per file.
+        """
         try:
-            if not os.path.exists(file_path):
-                return False
-            
-            if not file_path.lower().endswith('.odex'):
+            # One stat covers both the existence and the size check
+            if stat_result is None:
+                try:
+                    stat_result = os.stat(file_path)
+                except OSError:
+                    return False
+
+            # Check file size first (ODEX files should be at least a few KB)
+            if stat_result.st_size < 1024:  # Less than 1KB is suspicious
                 return False
-            
-            # Check file size (ODEX files should be at least a few KB)
-            file_size = os.path.getsize(file_path)
-            if file_size < 1024:  # Less than 1KB is suspicious
+
+            # Case-insensitive suffix check without lowering the whole path
+            if file_path[-5:].lower() != '.odex':
                 return False
-            
+
             # Check ODEX magic header
             return self._check_odex_header(file_path)
-            
+
         except Exception as e:
             logger.error("ODEX validation failed", file=file_path, error=str(e))
             return False
@@ -62,22 +118,17 @@ class FileValidator:
     def validate_framework_directory(self, framework_dir: str) -> bool:
         """Validate framework directory contains necessary files"""
         try:
-            if not os.path.exists(framework_dir) or not os.path.isdir(framework_dir):
+            try:
+                st = os.stat(framework_dir)
+            except OSError:
                 return False
-            
-            # Check for common framework files
-            framework_files = ['framework.jar', 'core.jar', 'android.jar']
-            found_files = os.listdir(framework_dir)
-            
-            # At least one framework file should exist
-            for fw_file in framework_files:
-                if fw_file in found_files:
-                    return True
-            
-            # Also check for .odex files in framework
-            odex_files = [f for f in found_files if f.endswith('.odex')]
-            return len(odex_files) > 0
-            
+            if not os.path.isdir(framework_dir):
+                return False
+
+            # Directory mtime changes when entries are added or removed,
+            # so repeated validation of the same tree is a cache hit
+            return _validate_framework_cached(framework_dir, st.st_mtime_ns)
+
         except Exception as e:
             logger.error("Framework validation failed", directory=framework_dir, error=str(e))
             return False
@@ -85,43 +136,42 @@ class FileValidator:
     def validate_baksmali_jar(self, jar_path: str) -> bool:
         """Validate baksmali JAR file"""
         try:
-            if not os.path.exists(jar_path):
-                return False
-            
             if not jar_path.lower().endswith('.jar'):
                 return False
-            
-            # Check if it's a valid ZIP/JAR file
-            import zipfile
+
             try:
-                with zipfile.ZipFile(jar_path, 'r') as jar:
-                    # Check for baksmali-specific files
-                    file_list = jar.namelist()
-                    if any('baksmali' in f.lower() for f in file_list):
-                        return True
-                    if 'META-INF/MANIFEST.MF' in file_list:
-                        return True
-            except zipfile.BadZipFile:
+                st = os.stat(jar_path)
+            except OSError:
                 return False
-            
-            return True
-            
+
+            # Re-opening the same unchanged JAR is a cache hit
+            return _validate_jar_cached(jar_path, st.st_mtime_ns, st.st_size)
+
         except Exception as e:
             logger.error("Baksmali JAR validation failed", jar=jar_path, error=str(e))
             return False
 
 
+# Size-class tables for batch analysis, indexed by np.digitize bin;
+# right=True bins reproduce analyze_file's strict > 10 / > 50 MB branches
+_SIZE_BINS_MB = (10.0, 50.0)
+_COMPLEXITY_LEVELS = ('low', 'medium', 'high')
+_ESTIMATED_TIMES = (10.0, 30.0, 120.0)
+
+
 class FileAnalyzer:
     """Advanced file analysis for optimization"""
-    
+
     def analyze_file(self, file_path: str) -> Dict[str, Any]:
         """Analyze file and return metadata for optimization"""
         try:
+            # Single stat; both size fields derive from st_size
+            size_bytes = os.stat(file_path).st_size
             file_info = {
                 'path': file_path,
                 'name': os.path.basename(file_path),
-                'size_bytes': os.path.getsize(file_path),
-                'size_mb': os.path.getsize(file_path) / (1024 * 1024),
+                'size_bytes': size_bytes,
+                'size_mb': size_bytes / (1024 * 1024),
                 'hash': self._calculate_file_hash(file_path),
                 'complexity': 'medium',  # Default complexity
                 'estimated_time': 0.0,
@@ -149,14 +199,98 @@ class FileAnalyzer:
             logger.error("File analysis failed", file=file_path, error=str(e))
             return {'path': file_path, 'error': str(e)}
     
+    def analyze_files(self, file_paths: List[str],
+                      workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Analyze many files in parallel, preserving input order
+
+        Hashing dominates the per-file cost and hashlib/blake3 release
+        the GIL during their C update loops, so a thread pool scales
+        across cores without the pickling cost of worker processes.
+        """
+        if not file_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            return list(executor.map(self.analyze_file, file_paths))
+
+    def analyze_batch(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """Analyze many files with vectorized size classification
+
+        Gathers all sizes up front and classifies the whole batch in one
+        np.digitize call instead of per-file if/elif branches, then fills
+        in the per-file hash and header fields.
+        """
+        if not file_paths:
+            return []
+
+        def _size_or_negative(path: str) -> int:
+            try:
+                return os.stat(path).st_size
+            except OSError:
+                return -1
+
+        sizes = np.fromiter(
+            (_size_or_negative(p) for p in file_paths),
+            dtype=np.int64, count=len(file_paths)
+        )
+        bins = np.digitize(sizes / (1024 * 1024), _SIZE_BINS_MB, right=True)
+
+        results = []
+        for path, size, bin_index in zip(file_paths, sizes, bins):
+            if size < 0:
+                results.append({'path': path, 'error': 'File not accessible'})
+                continue
+
+            file_info = {
+                'path': path,
+                'name': os.path.basename(path),
+                'size_bytes': int(size),
+                'size_mb': size / (1024 * 1024),
+                'hash': self._calculate_file_hash(path),
+                'complexity': _COMPLEXITY_LEVELS[bin_index],
+                'estimated_time': _ESTIMATED_TIMES[bin_index],
+                'optimization_hints': ['large_file'] if bin_index == 2 else []
+            }
+            file_info.update(self._analyze_odex_specifics(path))
+            results.append(file_info)
+
+        return results
+
+    def hash_many(self, file_paths: List[str]) -> Dict[str, str]:
+        """Hash many files concurrently, mapping path to hex digest
+
+        The digest update loops release the GIL, so threads scale with
+        core count here without process IPC costs.
+        """
+        if not file_paths:
+            return {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return dict(zip(file_paths,
+                            executor.map(self._calculate_file_hash, file_paths)))
+
     def _calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA-256 hash of file"""
+        """Calculate content hash of file (BLAKE3 if available, else SHA-256)"""
         try:
-            hash_sha256 = hashlib.sha256()
+            if blake3 is not None:
+                return blake3.blake3().update_mmap(file_path).hexdigest()
+
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                if os.fstat(f.fileno()).st_size > 2 * 1024 * 1024:
+                    # Hash the whole mapping in one GIL-released OpenSSL
+                    # call; hint the kernel to prefetch sequentially
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        return hashlib.sha256(mm).hexdigest()
+
+                if hasattr(hashlib, 'file_digest'):
+                    # C-level loop over the descriptor, no per-chunk
+                    # Python dispatch (3.11+)
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+
+                hash_sha256 = hashlib.sha256()
+                for chunk in iter(lambda: f.read(65536), b""):
                     hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                return hash_sha256.hexdigest()
         except Exception:
             return ""
     
@@ -170,18 +304,22 @@ class FileAnalyzer:
         }
         
         try:
-            with open(file_path, 'rb') as f:
-                # Read basic ODEX header information
-                header = f.read(40)  # Read first 40 bytes
-                
-                if len(header) >= 8 and header[:4] == b'dey\n':
-                    # Parse ODEX version
-                    version = header[4:8]
-                    odex_info['dex_version'] = version.decode('ascii', errors='ignore')
-                
-                # Add more detailed analysis as needed
-                # This would require understanding of ODEX format
-                
+            # Raw pread of the header: one open/read/close per file with
+            # no buffered-IO object allocation
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                header = os.pread(fd, 40, 0)  # Read first 40 bytes
+            finally:
+                os.close(fd)
+
+            if len(header) >= 8 and header[:4] == b'dey\n':
+                # Parse ODEX version
+                version = struct.unpack_from('4s', header, 4)[0]
+                odex_info['dex_version'] = version.decode('ascii', errors='ignore')
+
+            # Add more detailed analysis as needed
+            # This would require understanding of ODEX format
+
         except Exception as e:
             logger.debug("ODEX-specific analysis failed", file=file_path, error=str(e))
         
@@ -2,9 +2,12 @@
 Performance monitoring utilities
 """
 
+import os
 import time
+import numpy as np
 import psutil
 import threading
+import weakref
 from typing import Dict, Any, List, Callable, Optional
 from collections import defaultdict, deque
 from datetime import datetime
@@ -12,30 +15,88 @@ from datetime import datetime
 from ..core.logger import logger
 
 
+class _OperationRing:
+    """Fixed-size struct-of-arrays metric buffer for one operation
+
+    Packs each sample into parallel numpy arrays (~24 bytes) instead of
+    a per-sample dict, and lets the stats reduce with vectorized ops.
+    """
+
+    __slots__ = ('durations', 'sizes', 'throughputs', 'timestamps_ns',
+                 'index', 'count')
+
+    def __init__(self, capacity: int):
+        self.durations = np.empty(capacity, dtype=np.float32)
+        self.sizes = np.empty(capacity, dtype=np.int64)
+        self.throughputs = np.empty(capacity, dtype=np.float32)
+        self.timestamps_ns = np.empty(capacity, dtype=np.int64)
+        self.index = 0
+        self.count = 0
+
+    def append(self, duration: float, file_size: int, throughput: float,
+               ts_ns: int) -> None:
+        i = self.index
+        self.durations[i] = duration
+        self.sizes[i] = file_size
+        self.throughputs[i] = throughput
+        self.timestamps_ns[i] = ts_ns
+        capacity = len(self.durations)
+        self.index = (i + 1) % capacity
+        if self.count < capacity:
+            self.count += 1
+
+
 class PerformanceMonitor:
     """Advanced performance monitoring and metrics collection"""
-    
+
+    # One process-wide sampler thread feeds every monitor instance, so
+    # GUI and CLI monitors don't each burn an OS thread and its wakeups
+    _instances = weakref.WeakSet()
+    _sampler_thread: Optional[threading.Thread] = None
+    _sampler_lock = threading.Lock()
+
     def __init__(self, history_size: int = 1000):
         self.history_size = history_size
-        self.operation_metrics = defaultdict(lambda: deque(maxlen=history_size))
+        self.operation_metrics = defaultdict(lambda: _OperationRing(history_size))
         self.system_metrics = deque(maxlen=history_size)
         self.monitoring_active = False
         self.monitoring_thread = None
+        # Disk stats go through a portable root ('/' is wrong on Windows)
+        # and are refreshed only occasionally, since usage changes slowly
+        self._disk_root = os.path.abspath(os.sep)
+        self._disk_sample = None
+        self._disk_sample_age = 0
+        # Prime the CPU counter so later interval=None reads return the
+        # delta since the previous sample instead of a meaningless 0.0
+        psutil.cpu_percent(interval=None)
         self._start_monitoring()
     
     def _start_monitoring(self) -> None:
-        """Start background system monitoring"""
+        """Register with the shared sampler, starting it on first use"""
         self.monitoring_active = True
-        self.monitoring_thread = threading.Thread(target=self._monitor_system, daemon=True)
-        self.monitoring_thread.start()
-    
-    def _monitor_system(self) -> None:
-        """Background system monitoring loop"""
-        while self.monitoring_active:
+        with PerformanceMonitor._sampler_lock:
+            PerformanceMonitor._instances.add(self)
+            if PerformanceMonitor._sampler_thread is None:
+                PerformanceMonitor._sampler_thread = threading.Thread(
+                    target=PerformanceMonitor._monitor_loop, daemon=True
+                )
+                PerformanceMonitor._sampler_thread.start()
+        self.monitoring_thread = PerformanceMonitor._sampler_thread
+
+    @classmethod
+    def _monitor_loop(cls) -> None:
+        """Shared sampling loop feeding every active monitor instance"""
+        while True:
             try:
-                metrics = self._collect_system_metrics()
-                self.system_metrics.append(metrics)
-                time.sleep(30)  # Collect every 30 seconds
+                # Snapshot under the lock: registration from other
+                # threads must not resize the set mid-iteration
+                with cls._sampler_lock:
+                    active = [m for m in cls._instances if m.monitoring_active]
+                if active:
+                    metrics = active[0]._collect_system_metrics()
+                    for monitor in active:
+                        monitor.system_metrics.append(metrics)
+                time.sleep(5)  # Collection is non-blocking, sample often
             except Exception as e:
                 logger.error("System monitoring error", error=str(e))
                 time.sleep(60)  # Wait longer on error
@@ -43,9 +104,17 @@ class PerformanceMonitor:
     def _collect_system_metrics(self) -> Dict[str, Any]:
         """Collect current system metrics"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Non-blocking: returns usage since the previous sample rather
+            # than parking the monitor thread for a full second
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+
+            # Re-stat the filesystem only every 10th sample
+            if self._disk_sample is None or self._disk_sample_age >= 10:
+                self._disk_sample = psutil.disk_usage(self._disk_root)
+                self._disk_sample_age = 0
+            self._disk_sample_age += 1
+            disk = self._disk_sample
             
             return {
                 'timestamp': datetime.now(),
@@ -67,18 +136,12 @@ class PerformanceMonitor:
     def log_operation(self, operation: str, duration: float, file_size: int = 0, **kwargs) -> None:
         """Log operation performance metrics"""
         try:
-            metrics = {
-                'timestamp': datetime.now(),
-                'operation': operation,
-                'duration': duration,
-                'file_size': file_size,
-                'throughput_mb_s': (file_size / (1024 * 1024)) / duration if duration > 0 else 0,
-                **kwargs
-            }
-            
-            self.operation_metrics[operation].append(metrics)
-            
-            logger.info("Performance metric recorded", 
+            throughput = (file_size / (1024 * 1024)) / duration if duration > 0 else 0
+            self.operation_metrics[operation].append(
+                duration, file_size, throughput, time.time_ns()
+            )
+
+            logger.info("Performance metric recorded",
                        operation=operation, 
                        duration=duration,
                        file_size_mb=file_size / (1024 * 1024) if file_size > 0 else 0)
@@ -89,29 +152,31 @@ class PerformanceMonitor:
     def get_operation_stats(self, operation: str) -> Dict[str, Any]:
         """Get statistics for a specific operation"""
         try:
-            metrics = list(self.operation_metrics[operation])
-            if not metrics:
+            ring = self.operation_metrics[operation]
+            if ring.count == 0:
                 return {'operation': operation, 'count': 0}
-            
-            durations = [m['duration'] for m in metrics]
-            throughputs = [m['throughput_mb_s'] for m in metrics if m['throughput_mb_s'] > 0]
-            
+
+            durations = ring.durations[:ring.count]
+            throughputs = ring.throughputs[:ring.count]
+            last_ns = int(ring.timestamps_ns[(ring.index - 1) % len(ring.durations)])
+
             stats = {
                 'operation': operation,
-                'count': len(metrics),
-                'avg_duration': sum(durations) / len(durations),
-                'min_duration': min(durations),
-                'max_duration': max(durations),
-                'total_duration': sum(durations),
-                'last_operation': metrics[-1]['timestamp'].isoformat()
+                'count': ring.count,
+                'avg_duration': float(durations.mean()),
+                'min_duration': float(durations.min()),
+                'max_duration': float(durations.max()),
+                'total_duration': float(durations.sum()),
+                'last_operation': datetime.fromtimestamp(last_ns / 1e9).isoformat()
             }
-            
-            if throughputs:
+
+            positive = throughputs[throughputs > 0]
+            if positive.size:
                 stats.update({
-                    'avg_throughput_mb_s': sum(throughputs) / len(throughputs),
-                    'max_throughput_mb_s': max(throughputs)
+                    'avg_throughput_mb_s': float(positive.mean()),
+                    'max_throughput_mb_s': float(positive.max())
                 })
-            
+
             return stats
             
         except Exception as e:
@@ -180,10 +245,10 @@ class PerformanceMonitor:
             logger.error("Failed to reset metrics", error=str(e))
     
     def stop_monitoring(self) -> None:
-        """Stop background monitoring"""
+        """Stop feeding this monitor from the shared sampler"""
         self.monitoring_active = False
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=5)
+        with PerformanceMonitor._sampler_lock:
+            PerformanceMonitor._instances.discard(self)
         logger.info("Performance monitoring stopped")
 
 
@@ -194,22 +259,24 @@ class OperationTimer:
         self.operation_name = operation_name
         self.monitor = monitor
         self.kwargs = kwargs
-        self.start_time = None
-        self.end_time = None
-    
+        self.start_ns = None
+        self.end_ns = None
+
     def __enter__(self):
-        self.start_time = time.time()
+        # Monotonic nanosecond clock: immune to wall-clock jumps and
+        # precise enough for sub-millisecond operations
+        self.start_ns = time.perf_counter_ns()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time
-        
+        self.end_ns = time.perf_counter_ns()
+        duration = (self.end_ns - self.start_ns) / 1e9
+
         # Log the operation
         self.monitor.log_operation(
-            self.operation_name, 
-            duration, 
+            self.operation_name,
+            duration,
             **self.kwargs
         )
-        
+
         return False  # Don't suppress exceptions
\ No newline at end of file
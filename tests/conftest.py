@@ -0,0 +1,35 @@
+"""
+Shared pytest configuration for the test suite
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the src layout importable once for the whole session instead of
+# per test module; resolve() collapses symlinks and '..' so the cached
+# path compares equal to anything already on sys.path
+_SRC = str(Path(__file__).resolve().parents[1] / 'src')
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'slow: marks tests as slow (deselect with -m "not slow")'
+    )
+
+
+@pytest.fixture(scope='session')
+def _pristine_config():
+    """Load the YAML configuration once for the whole session"""
+    from deodexer_pro.core.config import Config
+    return Config()
+
+
+@pytest.fixture
+def config(_pristine_config):
+    """Per-test Config copy; mutations never leak between tests"""
+    return copy.deepcopy(_pristine_config)
@@ -3,80 +3,72 @@ Test configuration management
 """
 
 import pytest
-import tempfile
-import os
-from pathlib import Path
-
-# Add src to path for testing
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
-
-from deodexer_pro.core.config import Config
 
 
 class TestConfig:
     """Test configuration management functionality"""
-    
-    def test_default_config_creation(self):
+
+    def test_default_config_creation(self, config):
         """Test creation of default configuration"""
-        config = Config()
         assert config.get('app.name') is not None
         assert config.get('app.version') is not None
-    
-    def test_config_get_with_default(self):
+
+    def test_config_get_with_default(self, config):
         """Test getting configuration values with defaults"""
-        config = Config()
-        
         # Test existing value
         assert config.get('app.name') == 'Deodexer Pro'
-        
+
         # Test non-existing value with default
         assert config.get('non.existing.key', 'default_value') == 'default_value'
-        
+
         # Test non-existing value without default
         assert config.get('non.existing.key') is None
-    
-    def test_config_set_and_get(self):
+
+    def test_config_set_and_get(self, config):
         """Test setting and getting configuration values"""
-        config = Config()
-        
         # Set a value
         config.set('test.setting', 'test_value')
         assert config.get('test.setting') == 'test_value'
-        
+
         # Set nested value
         config.set('test.nested.setting', 42)
         assert config.get('test.nested.setting') == 42
-    
-    def test_config_validation(self):
+
+        # Pre-split tuple keys resolve to the same entries
+        assert config.get(('test', 'setting')) == 'test_value'
+        config.set(('test', 'nested', 'setting'), 43)
+        assert config.get('test.nested.setting') == 43
+
+    def test_config_validation(self, config):
         """Test configuration validation"""
-        config = Config()
-        
         # Valid configuration should pass
         assert config.validate() is True
-        
+
         # Test with invalid max_workers
         original_value = config.get('deodexing.max_workers')
         config.set('deodexing.max_workers', -1)
         assert config.validate() is False
-        
+
         # Restore valid value
         config.set('deodexing.max_workers', original_value)
         assert config.validate() is True
-    
-    def test_config_to_dict(self):
+
+    def test_config_to_dict(self, config):
         """Test configuration to dictionary conversion"""
-        config = Config()
         config_dict = config.to_dict()
-        
-        assert isinstance(config_dict, dict)
-        assert 'app' in config_dict
-        assert 'deodexing' in config_dict
-    
-    def test_config_update(self):
+
+        assert {'app', 'deodexing'} <= config_dict.keys()
+
+        # The view is read-only; mutating it cannot corrupt the cache
+        with pytest.raises(TypeError):
+            config_dict['injected'] = True
+
+        # Writes invalidate the memoized view
+        config.set('test.flag', True)
+        assert config.to_dict()['test']['flag'] is True
+
+    def test_config_update(self, config):
         """Test configuration update functionality"""
-        config = Config()
-        
         # Update with new configuration
         new_config = {
             'test': {
@@ -85,10 +77,10 @@ class TestConfig:
             }
         }
         config.update(new_config)
-        
-        assert config.get('test.key1') == 'value1'
-        assert config.get('test.key2') == 'value2'
+
+        expected = {'test.key1': 'value1', 'test.key2': 'value2'}
+        assert {path: config.get(path) for path in expected} == expected
 
 
 if __name__ == '__main__':
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])